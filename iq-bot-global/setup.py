@@ -9,6 +9,7 @@ setup(
     install_requires=[
         "pyyaml>=6.0.1",
         "redis>=6.0.0",
+        "hiredis>=2.0.0",
         "python-dotenv>=1.0.0",
     ],
     python_requires=">=3.9",
@@ -1,11 +1,16 @@
 """Package initialization for iq-bot-global."""
 
-from .services.redis_service import RedisService
+from .services.redis_service import RedisService, get_redis
 from .utils import (
     extract_context_params,
+    generated_prompt_key,
+    generated_prompt_pattern,
 )
 
 __all__ = [
     'RedisService',
-    'extract_context_params'
+    'get_redis',
+    'extract_context_params',
+    'generated_prompt_key',
+    'generated_prompt_pattern'
 ]
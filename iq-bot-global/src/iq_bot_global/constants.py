@@ -1,103 +1,177 @@
-"""Global constants shared across IQ services."""
+"""Global constants shared across IQ services.
 
-from dataclasses import dataclass
-from typing import Final
+Each value is defined once as a plain module-level constant, which hot paths
+can import directly. The grouped objects (FILE_PATHS, CACHE_TTL, ...) expose
+the same values for existing callers.
+"""
 
+from typing import Final, NamedTuple
 
 # File paths and directories
-@dataclass(frozen=True)
-class FilePaths:
+RESOURCES_DIR: Final[str] = "resources"
+MAPPINGS_DIR: Final[str] = "mappings"
+PROMPT_CONTENTS_DIR: Final[str] = "prompt-contents"
+STYLE_GUIDE_DIR: Final[str] = "style-guide"
+SYSTEM_DIR: Final[str] = "system"
+
+# Files
+STYLE_GUIDE_FILE: Final[str] = "guide.yaml"
+SYSTEM_FILE: Final[str] = "system.txt"
+TEMPLATES_FILE: Final[str] = "prompt-templates.yaml"
+
+
+class FilePaths(NamedTuple):
     """File paths and directory constants."""
-    RESOURCES_DIR: str = "resources"
-    MAPPINGS_DIR: str = "mappings"
-    PROMPT_CONTENTS_DIR: str = "prompt-contents"
-    STYLE_GUIDE_DIR: str = "style-guide"
-    SYSTEM_DIR: str = "system"
+    RESOURCES_DIR: str = RESOURCES_DIR
+    MAPPINGS_DIR: str = MAPPINGS_DIR
+    PROMPT_CONTENTS_DIR: str = PROMPT_CONTENTS_DIR
+    STYLE_GUIDE_DIR: str = STYLE_GUIDE_DIR
+    SYSTEM_DIR: str = SYSTEM_DIR
 
     # Files
-    STYLE_GUIDE_FILE: str = "guide.yaml"
-    SYSTEM_FILE: str = "system.txt"
-    TEMPLATES_FILE: str = "prompt-templates.yaml"
+    STYLE_GUIDE_FILE: str = STYLE_GUIDE_FILE
+    SYSTEM_FILE: str = SYSTEM_FILE
+    TEMPLATES_FILE: str = TEMPLATES_FILE
 
 
 FILE_PATHS = FilePaths()
 
-# Redis constants
-REDIS_KEY_PREFIX: Final[str] = "iq:"
-REDIS_PROMPT_KEY: Final[str] = f"{REDIS_KEY_PREFIX}prompt:"
-REDIS_GENERATED_PROMPT_KEY: Final[str] = f"{REDIS_KEY_PREFIX}generated-prompt:"
-REDIS_API_CACHE_KEY: Final[str] = f"{REDIS_KEY_PREFIX}api:"
+# Cache TTL and timeframes, in seconds
+CACHE_TTL_DEFAULT: Final[int] = 3600  # 1 hour
+CACHE_TTL_HOUR: Final[int] = 3600
+CACHE_TTL_DAY: Final[int] = 86400
+CACHE_TTL_WEEK: Final[int] = 604800
 
 
-# Cache TTL and timeframes
-@dataclass(frozen=True)
-class CacheTTL:
+class CacheTTL(NamedTuple):
     """Cache time-to-live constants in seconds."""
-    DEFAULT: int = 3600  # 1 hour
-    HOUR: int = 3600
-    DAY: int = 86400
-    WEEK: int = 604800
+    DEFAULT: int = CACHE_TTL_DEFAULT
+    HOUR: int = CACHE_TTL_HOUR
+    DAY: int = CACHE_TTL_DAY
+    WEEK: int = CACHE_TTL_WEEK
 
 
 CACHE_TTL = CacheTTL()
 
-
 # Redis configuration
-@dataclass(frozen=True)
-class RedisConfig:
+REDIS_DEFAULT_HOST: Final[str] = "localhost"
+REDIS_DEFAULT_PORT: Final[int] = 6379
+REDIS_DEFAULT_PASSWORD: Final[str] = ""
+REDIS_DEFAULT_POOL_SIZE: Final[int] = 32
+REDIS_HEALTH_CHECK_INTERVAL: Final[int] = 30  # seconds
+REDIS_ASYNC_FLUSH_SIZE: Final[int] = 128  # queued writes before a fire-and-forget flush
+REDIS_ASYNC_FLUSH_INTERVAL: Final[float] = 0.05  # seconds before queued writes are flushed
+REDIS_SCAN_COUNT: Final[int] = 1000  # keys requested per SCAN iteration
+
+
+class RedisConfig(NamedTuple):
     """Redis connection configuration defaults."""
-    DEFAULT_HOST: str = "localhost"
-    DEFAULT_PORT: int = 6379
-    DEFAULT_PASSWORD: str = ""
+    DEFAULT_HOST: str = REDIS_DEFAULT_HOST
+    DEFAULT_PORT: int = REDIS_DEFAULT_PORT
+    DEFAULT_PASSWORD: str = REDIS_DEFAULT_PASSWORD
+    DEFAULT_POOL_SIZE: int = REDIS_DEFAULT_POOL_SIZE
+    HEALTH_CHECK_INTERVAL: int = REDIS_HEALTH_CHECK_INTERVAL
+    ASYNC_FLUSH_SIZE: int = REDIS_ASYNC_FLUSH_SIZE
+    ASYNC_FLUSH_INTERVAL: float = REDIS_ASYNC_FLUSH_INTERVAL
+    SCAN_COUNT: int = REDIS_SCAN_COUNT
 
 
 REDIS_CONFIG = RedisConfig()
 
-
 # Flask configuration
-@dataclass(frozen=True)
-class FlaskConfig:
+FLASK_DEFAULT_HOST: Final[str] = "0.0.0.0"
+FLASK_DEFAULT_PORT: Final[int] = 6000
+
+
+class FlaskConfig(NamedTuple):
     """Flask application configuration defaults."""
-    DEFAULT_HOST: str = "0.0.0.0"
-    DEFAULT_PORT: int = 6000
+    DEFAULT_HOST: str = FLASK_DEFAULT_HOST
+    DEFAULT_PORT: int = FLASK_DEFAULT_PORT
 
 
 FLASK_CONFIG = FlaskConfig()
 
+# Writer configuration
+WRITER_DEFAULT_MAX_WORKERS: Final[int] = 16  # prompt responses generated concurrently
+WRITER_DEFAULT_API_WORKERS: Final[int] = 8  # context API calls made concurrently for the prompts in flight
+WRITER_DEFAULT_OPENAI_BATCH_SIZE: Final[int] = 1  # prompts of a topic answered per OpenAI request, 1 disables batching
+WRITER_DEFAULT_BATCH_API_THRESHOLD: Final[int] = 0  # uncached prompts sent to the Batch API at once, 0 disables it
+WRITER_BATCH_API_JOB_TTL: Final[int] = 2 * CACHE_TTL_DAY  # outlives the 24h completion window of a Batch API job
+
+
+class WriterConfig(NamedTuple):
+    """Writer batch processing defaults."""
+    DEFAULT_MAX_WORKERS: int = WRITER_DEFAULT_MAX_WORKERS
+    DEFAULT_API_WORKERS: int = WRITER_DEFAULT_API_WORKERS
+    DEFAULT_OPENAI_BATCH_SIZE: int = WRITER_DEFAULT_OPENAI_BATCH_SIZE
+    DEFAULT_BATCH_API_THRESHOLD: int = WRITER_DEFAULT_BATCH_API_THRESHOLD
+    BATCH_API_JOB_TTL: int = WRITER_BATCH_API_JOB_TTL
+
+
+WRITER_CONFIG = WriterConfig()
 
 # Redis key patterns
-@dataclass(frozen=True)
-class RedisKeys:
+REDIS_KEY_PREFIX: Final[str] = "iq:"
+REDIS_PROMPT_PREFIX: Final[str] = f"{REDIS_KEY_PREFIX}prompt-response"
+REDIS_GENERATED_PROMPT_PREFIX: Final[str] = f"{REDIS_KEY_PREFIX}generated-prompt"
+REDIS_API_CACHE_PREFIX: Final[str] = f"{REDIS_KEY_PREFIX}api"
+
+# Secondary index hashes mapping a generated prompt ID to its full Redis key
+REDIS_PROMPT_INDEX_KEY: Final[str] = f"{REDIS_KEY_PREFIX}prompt-index"
+REDIS_RESPONSE_INDEX_KEY: Final[str] = f"{REDIS_KEY_PREFIX}prompt-response-index"
+# Prefix of the per-topic sets holding the keys of that topic's generated prompts
+REDIS_TOPIC_INDEX_PREFIX: Final[str] = f"{REDIS_KEY_PREFIX}topic"
+# Prefix of the records of submitted OpenAI Batch API jobs, mapping each response key to its prompt
+REDIS_BATCH_JOB_PREFIX: Final[str] = f"{REDIS_KEY_PREFIX}batch-job"
+
+# Key prefixes including the trailing separator, for building keys by concatenation
+REDIS_PROMPT_KEY: Final[str] = f"{REDIS_PROMPT_PREFIX}:"
+REDIS_GENERATED_PROMPT_KEY: Final[str] = f"{REDIS_GENERATED_PROMPT_PREFIX}:"
+REDIS_API_CACHE_KEY: Final[str] = f"{REDIS_API_CACHE_PREFIX}:"
+
+
+class RedisKeys(NamedTuple):
     """Redis key patterns and prefixes."""
-    PREFIX: str = "iq:"
-    PROMPT_PREFIX: str = f"{PREFIX}prompt-response"
-    GENERATED_PROMPT_PREFIX: str = f"{PREFIX}generated-prompt"
-    API_CACHE_PREFIX: str = f"{PREFIX}api"
+    PREFIX: str = REDIS_KEY_PREFIX
+    PROMPT_PREFIX: str = REDIS_PROMPT_PREFIX
+    GENERATED_PROMPT_PREFIX: str = REDIS_GENERATED_PROMPT_PREFIX
+    API_CACHE_PREFIX: str = REDIS_API_CACHE_PREFIX
+    PROMPT_INDEX: str = REDIS_PROMPT_INDEX_KEY
+    RESPONSE_INDEX: str = REDIS_RESPONSE_INDEX_KEY
+    TOPIC_INDEX_PREFIX: str = REDIS_TOPIC_INDEX_PREFIX
+    BATCH_JOB_PREFIX: str = REDIS_BATCH_JOB_PREFIX
 
 
 REDIS_KEYS = RedisKeys()
 
-
 # API configuration
-@dataclass(frozen=True)
-class OpenAIDefaults:
+OPENAI_DEFAULT_MODEL: Final[str] = "gpt-4.1-nano"
+OPENAI_DEFAULT_TEMPERATURE: Final[float] = 0.4
+
+
+class OpenAIDefaults(NamedTuple):
     """OpenAI configuration defaults."""
-    MODEL: str = "gpt-4.1-nano"
-    TEMPERATURE: float = 0.4
+    MODEL: str = OPENAI_DEFAULT_MODEL
+    TEMPERATURE: float = OPENAI_DEFAULT_TEMPERATURE
 
 
 OPENAI_DEFAULTS = OpenAIDefaults()
 
-
 # API response messages
-@dataclass(frozen=True)
-class APIResponseMessages:
+API_DEFAULT_ERROR: Final[str] = "Sorry, I am unable to assist with this query right now."
+API_PROMPT_NOT_FOUND: Final[str] = "Prompt not found"
+API_PROMPT_NOT_FOUND_WITH_ID: Final[str] = "No template or prompt found with ID: {prompt_id}"
+API_RESPONSE_NOT_FOUND_WITH_ID: Final[str] = "No response found for prompt ID: {prompt_id}"
+API_FAILED_TO_LOAD: Final[str] = "Failed to load prompts"
+
+
+class APIResponseMessages(NamedTuple):
     """API response message templates."""
-    DEFAULT_ERROR: str = "Sorry, I am unable to assist with this query right now."
-    PROMPT_NOT_FOUND: str = "Prompt not found"
-    PROMPT_NOT_FOUND_WITH_ID: str = "No template or prompt found with ID: {prompt_id}"
-    RESPONSE_NOT_FOUND_WITH_ID: str = "No response found for prompt ID: {prompt_id}"
-    FAILED_TO_LOAD: str = "Failed to load prompts"
+    DEFAULT_ERROR: str = API_DEFAULT_ERROR
+    PROMPT_NOT_FOUND: str = API_PROMPT_NOT_FOUND
+    PROMPT_NOT_FOUND_WITH_ID: str = API_PROMPT_NOT_FOUND_WITH_ID
+    RESPONSE_NOT_FOUND_WITH_ID: str = API_RESPONSE_NOT_FOUND_WITH_ID
+    FAILED_TO_LOAD: str = API_FAILED_TO_LOAD
 
 
 API_RESPONSE_MESSAGES = APIResponseMessages()
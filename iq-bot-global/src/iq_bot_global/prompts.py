@@ -1,10 +1,77 @@
 """Module for managing prompt-related configuration."""
 
+import functools
+import mmap
 import os
-import pathlib
+from typing import Dict, Any, Optional
 
-TEMPLATES_PATH = os.path.join(
-    pathlib.Path(__file__).parent,
-    'resources',
-    'prompt-templates.yaml'
-)
+import yaml
+
+from iq_bot_global.constants import RESOURCES_DIR, TEMPLATES_FILE
+
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+TEMPLATES_PATH = os.path.join(_HERE, RESOURCES_DIR, TEMPLATES_FILE)
+
+
+@functools.lru_cache(maxsize=1)
+def load_prompts() -> Dict[str, Any]:
+    """
+    Load and parse the prompt templates file once per process.
+
+    The templates file is immutable at runtime, so the parsed result is memoized
+    and shared by every caller. Use ``load_prompts.cache_clear()`` to force a reload.
+    The file is memory-mapped so libyaml reads straight from the page cache.
+
+    Returns:
+        Dict[str, Any]: Prompt templates grouped by topic.
+
+    Raises:
+        OSError: If the templates file cannot be read
+        ValueError: If the templates file is empty
+        yaml.YAMLError: If the templates file is not valid YAML
+    """
+    with open(TEMPLATES_PATH, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return yaml.load(mapped, Loader=CSafeLoader)['prompts']
+
+
+@functools.lru_cache(maxsize=1)
+def _prompts_by_id() -> Dict[str, Dict[str, Any]]:
+    """
+    Build an index of prompt templates keyed by their unique identifier.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Prompt template configurations keyed by ID.
+    """
+    return {
+        template['id']: template
+        for topic_templates in load_prompts().values()
+        if isinstance(topic_templates, list)
+        for template in topic_templates
+        if isinstance(template, dict) and 'id' in template
+    }
+
+
+def get_prompt_by_id(prompt_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a prompt template configuration by its unique identifier.
+
+    Args:
+        prompt_id: Unique identifier of the prompt template to retrieve
+
+    Returns:
+        Optional[Dict[str, Any]]: Prompt template configuration if found, None otherwise.
+    """
+    return _prompts_by_id().get(prompt_id)
+
+
+def clear_prompts_cache() -> None:
+    """Clear the parsed templates and ID index to force reloading from file."""
+    load_prompts.cache_clear()
+    _prompts_by_id.cache_clear()
@@ -0,0 +1,8 @@
+"""Services package initialization."""
+
+from .redis_service import RedisService, get_redis
+
+__all__ = [
+    'RedisService',
+    'get_redis'
+]
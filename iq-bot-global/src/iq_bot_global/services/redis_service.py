@@ -1,61 +1,97 @@
 """Redis service for caching responses."""
 
+import atexit
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import redis
 from dotenv import load_dotenv
+from redis.utils import HIREDIS_AVAILABLE
 
-from iq_bot_global.constants import REDIS_CONFIG, CACHE_TTL
+from iq_bot_global.constants import (
+    CACHE_TTL_DEFAULT,
+    REDIS_ASYNC_FLUSH_INTERVAL,
+    REDIS_ASYNC_FLUSH_SIZE,
+    REDIS_DEFAULT_HOST,
+    REDIS_DEFAULT_PASSWORD,
+    REDIS_DEFAULT_POOL_SIZE,
+    REDIS_DEFAULT_PORT,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_SCAN_COUNT
+)
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
 
+class _SingletonMeta(type):
+    """Metaclass that constructs a class at most once and returns that instance thereafter."""
 
-class RedisService:
-    """Service for handling Redis caching operations."""
-
-    _instance = None
+    _lock = threading.Lock()
 
-    def __new__(cls):
+    def __call__(cls, *args, **kwargs):
         """
-        Implement singleton pattern to ensure only one Redis connection is created.
-        
+        Return the singleton instance, creating it on first use.
+        Once created, construction skips __init__ entirely.
+
         Returns:
-            RedisService: The singleton instance of the service
-            
-        Raises:
-            Exception: If singleton instantiation fails
+            The singleton instance of the class
         """
         if cls._instance is None:
-            cls._instance = super(RedisService, cls).__new__(cls)
-            cls._instance._initialized = False
+            with _SingletonMeta._lock:
+                if cls._instance is None:
+                    cls._instance = super().__call__(*args, **kwargs)
         return cls._instance
 
+
+class RedisService(metaclass=_SingletonMeta):
+    """Service for handling Redis caching operations."""
+
+    _instance = None
+
     def __init__(self):
         """
         Initialize Redis connection using environment variables.
+        Runs exactly once per process; later RedisService() calls return the same instance.
         
         Environment Variables:
             REDIS_HOST: Redis server hostname (default: localhost)
             REDIS_PORT: Redis server port (default: 6379)
             REDIS_PASSWORD: Redis server password (default: '')
+            REDIS_POOL_SIZE: Maximum number of pooled connections (default: 32)
+            IQ_SKIP_DOTENV: Set to '1' to never read a .env file
+
+        A .env file is only read when REDIS_HOST is not already exported,
+        so containers with a fully populated environment skip the file lookup.
             
         Raises:
             redis.RedisError: If connection cannot be established
         """
-        if self._initialized:
-            return
+        if os.getenv('IQ_SKIP_DOTENV') != '1' and not os.getenv('REDIS_HOST'):
+            load_dotenv()
 
-        self.redis_client = redis.Redis(
-            host=os.getenv('REDIS_HOST', REDIS_CONFIG.DEFAULT_HOST),
-            port=int(os.getenv('REDIS_PORT', REDIS_CONFIG.DEFAULT_PORT)),
-            password=os.getenv('REDIS_PASSWORD', REDIS_CONFIG.DEFAULT_PASSWORD),
+        # redis-py selects the hiredis C parser automatically when it is installed
+        if not HIREDIS_AVAILABLE:
+            logger.warning("hiredis is not installed, falling back to the pure-Python Redis parser")
+
+        self._pool = redis.BlockingConnectionPool(
+            host=os.getenv('REDIS_HOST', REDIS_DEFAULT_HOST),
+            port=int(os.getenv('REDIS_PORT', REDIS_DEFAULT_PORT)),
+            password=os.getenv('REDIS_PASSWORD', REDIS_DEFAULT_PASSWORD),
+            max_connections=int(os.getenv('REDIS_POOL_SIZE', REDIS_DEFAULT_POOL_SIZE)),
+            socket_keepalive=True,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
             decode_responses=False
         )
-        self._initialized = True
+        self.redis_client = redis.Redis(connection_pool=self._pool)
+
+        # Fire-and-forget writes queued by set_cached_response_async
+        self._pending = None
+        self._pending_count = 0
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        atexit.register(self.flush)
 
     def get_cached_response(self, cache_key: str) -> Optional[bytes]:
         """
@@ -77,9 +113,49 @@ class RedisService:
             logger.error(f"Redis error: {e}")
             return None
 
-    def set_cached_response(self, cache_key: str, response: str, ttl_seconds: int = CACHE_TTL.DEFAULT) -> bool:
+    def get_with_indexed(self, cache_key: str, index_name: str,
+                         field: str) -> Tuple[Optional[bytes], Optional[bytes], Optional[bytes]]:
+        """
+        Get a cached value together with a related value found through an index hash.
+        e.g., a generated prompt and the response stored under the key indexed by its prompt ID.
+
+        The value and the index field are fetched in one pipelined round-trip, and the related
+        value with a second GET only when both exist. Every key is sent by the client, so this
+        also works when the keys live on different cluster slots.
+
+        Args:
+            cache_key: The key to look up in Redis
+            index_name: The key of the index hash
+            field: The field of the index hash holding the related key
+
+        Returns:
+            Tuple[Optional[bytes], Optional[bytes], Optional[bytes]]: The cached value, the related key
+                and the related value, each None if not found. The related value is only fetched
+                when the cached value exists. All None if the operation failed.
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Fetching cache record and {index_name} entry from Redis for key {cache_key}")
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(cache_key)
+            pipe.hget(index_name, field)
+            value, indexed_key = pipe.execute()
+            indexed_value = None
+            if value is not None and indexed_key is not None:
+                indexed_value = self.redis_client.get(indexed_key)
+            return value, indexed_key, indexed_value
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return None, None, None
+
+    def set_cached_response(self, cache_key: str, response: Union[str, bytes],
+                            ttl_seconds: int = CACHE_TTL_DEFAULT) -> bool:
         """
         Cache a response in Redis with TTL.
+        Strings are encoded by the Redis client when the command is packed,
+        so no intermediate copy of the payload is made here.
         
         Args:
             cache_key: The key to store the response under
@@ -95,15 +171,338 @@ class RedisService:
         """
         try:
             logger.debug(f"Setting cache record to Redis for key {cache_key}")
-            return self.redis_client.setex(
-                cache_key,
-                ttl_seconds,
-                response.encode('utf-8') if isinstance(response, str) else response
-            )
+            return self.redis_client.setex(cache_key, ttl_seconds, response)
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return False
+
+    def setex_bytes(self, cache_key: str, ttl_seconds: int, payload: bytes) -> bool:
+        """
+        Cache an already-encoded payload in Redis with TTL.
+        Fast path for callers that hold bytes, skipping the debug logging of
+        set_cached_response.
+
+        Args:
+            cache_key: The key to store the payload under
+            ttl_seconds: Time-to-live in seconds
+            payload: The encoded payload to cache
+
+        Returns:
+            bool: True if successfully cached, False if operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            return self.redis_client.setex(cache_key, ttl_seconds, payload)
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return False
+
+    def set_cached_response_async(self, cache_key: str, response: Union[str, bytes],
+                                  ttl_seconds: int = CACHE_TTL_DEFAULT) -> None:
+        """
+        Queue a response to be cached in Redis without waiting for the write.
+        Queued writes are sent as a single pipeline once REDIS_ASYNC_FLUSH_SIZE writes are
+        pending or REDIS_ASYNC_FLUSH_INTERVAL seconds have passed, whichever comes first.
+        Use for non-critical caching only; call flush() before reading a key that
+        may still be queued.
+
+        Args:
+            cache_key: The key to store the response under
+            response: The response string or bytes to cache
+            ttl_seconds: Time-to-live in seconds (default: global default TTL)
+        """
+        self._queue_async(lambda pipe: pipe.setex(cache_key, ttl_seconds, response))
+
+    def _queue_async(self, queue_command: Callable[[redis.client.Pipeline], object]) -> None:
+        """
+        Add a write to the pending pipeline and schedule it to be flushed.
+
+        Args:
+            queue_command: Callable that queues the write on the given pipeline
+        """
+        with self._pending_lock:
+            if self._pending is None:
+                self._pending = self.redis_client.pipeline(transaction=False)
+            queue_command(self._pending)
+            self._pending_count += 1
+
+            if self._pending_count >= REDIS_ASYNC_FLUSH_SIZE:
+                self._flush_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(REDIS_ASYNC_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """
+        Send all writes queued by set_cached_response_async to Redis.
+
+        Returns:
+            bool: True if all queued writes succeeded (or none were queued), False otherwise
+        """
+        with self._pending_lock:
+            return self._flush_pending()
+
+    def _flush_pending(self) -> bool:
+        """
+        Execute the pending write pipeline. Must be called with _pending_lock held.
+
+        Returns:
+            bool: True if all queued writes succeeded (or none were queued), False otherwise
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        pipe, count = self._pending, self._pending_count
+        self._pending, self._pending_count = None, 0
+        if pipe is None:
+            return True
+
+        try:
+            logger.debug(f"Flushing {count} queued cache records to Redis")
+            pipe.execute()
+            return True
+        except redis.RedisError as e:
+            logger.error(f"Redis error while flushing {count} queued cache records: {e}")
+            return False
+
+    def set_indexed_responses(self, index_name: str,
+                              entries: List[Tuple[str, str, Union[str, bytes], int]]) -> bool:
+        """
+        Cache responses with TTL and record each one's key under its field of an index hash.
+        All the writes are sent as one pipeline, and only reported as cached once every
+        command in it has succeeded. Use instead of the queued writes when losing a write matters.
+
+        Args:
+            index_name: The key of the index hash
+            entries: (index field, cache key, response, ttl in seconds) for each response
+
+        Returns:
+            bool: True if every response and index entry was written, False otherwise
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Setting {len(entries)} indexed cache records to Redis")
+            pipe = self.redis_client.pipeline(transaction=False)
+            for field, cache_key, response, ttl_seconds in entries:
+                pipe.setex(cache_key, ttl_seconds, response)
+                pipe.hset(index_name, field, cache_key)
+            results = pipe.execute(raise_on_error=False)
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return False
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            logger.error(f"Redis error while setting {len(entries)} indexed cache records: {errors[0]}")
+            return False
+        return True
+
+    def hget_cached(self, name: str, field: str) -> Optional[bytes]:
+        """
+        Get a single field from a Redis hash.
+
+        Args:
+            name: The key of the hash
+            field: The field to look up in the hash
+
+        Returns:
+            Optional[bytes]: The field value if found, None otherwise
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Fetching field {field} from Redis hash {name}")
+            return self.redis_client.hget(name, field)
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return None
+
+    def hset_cached(self, name: str, field: str, value: Union[str, bytes]) -> bool:
+        """
+        Set a single field in a Redis hash.
+
+        Args:
+            name: The key of the hash
+            field: The field to set in the hash
+            value: The value to store in the field
+
+        Returns:
+            bool: True if successfully set, False if operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Setting field {field} in Redis hash {name}")
+            self.redis_client.hset(name, field, value)
+            return True
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return False
+
+    def hkeys_cached(self, name: str) -> List[bytes]:
+        """
+        Get all field names of a Redis hash.
+
+        Args:
+            name: The key of the hash
+
+        Returns:
+            List[bytes]: The field names of the hash, empty if not found or the operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Fetching field names of Redis hash {name}")
+            return self.redis_client.hkeys(name)
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return []
+
+    def sadd_cached(self, name: str, *values: Union[str, bytes]) -> bool:
+        """
+        Add members to a Redis set.
+
+        Args:
+            name: The key of the set
+            values: The members to add to the set
+
+        Returns:
+            bool: True if successfully added, False if operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Adding {len(values)} members to Redis set {name}")
+            self.redis_client.sadd(name, *values)
+            return True
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return False
+
+    def srem_cached(self, name: str, *values: Union[str, bytes]) -> bool:
+        """
+        Remove members from a Redis set.
+
+        Args:
+            name: The key of the set
+            values: The members to remove from the set
+
+        Returns:
+            bool: True if successfully removed, False if operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Removing {len(values)} members from Redis set {name}")
+            self.redis_client.srem(name, *values)
+            return True
         except redis.RedisError as e:
             logger.error(f"Redis error: {e}")
             return False
 
+    def smembers_cached(self, name: str) -> List[bytes]:
+        """
+        Get all members of a Redis set.
+
+        Args:
+            name: The key of the set
+
+        Returns:
+            List[bytes]: The members of the set, empty if not found or the operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Fetching members of Redis set {name}")
+            return list(self.redis_client.smembers(name))
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return []
+
+    def prune_hash_index(self, name: str, chunk_size: int = REDIS_SCAN_COUNT) -> int:
+        """
+        Remove the fields of an index hash whose indexed key no longer exists.
+        The indexed keys expire on their own, while the hash has no TTL, so this keeps it
+        from growing with every key ever indexed. Fields are read with HSCAN and the
+        indexed keys checked with one MGET per chunk.
+
+        Args:
+            name: The key of the index hash, whose field values are the indexed keys
+            chunk_size: Number of fields to check with a single MGET
+
+        Returns:
+            int: The number of fields removed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            entries = list(self.redis_client.hscan_iter(name, count=chunk_size))
+            removed = 0
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start:start + chunk_size]
+                values = self.redis_client.mget([indexed_key for _, indexed_key in chunk])
+                dead_fields = [field for (field, _), value in zip(chunk, values) if value is None]
+                if dead_fields:
+                    removed += self.redis_client.hdel(name, *dead_fields)
+            logger.debug(f"Removed {removed} expired entries from Redis hash {name}")
+            return removed
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return 0
+
+    def prune_set_index(self, name: str, chunk_size: int = REDIS_SCAN_COUNT) -> int:
+        """
+        Remove the members of an index set that are keys which no longer exist.
+        Like prune_hash_index, for sets whose members are the indexed keys themselves.
+
+        Args:
+            name: The key of the index set
+            chunk_size: Number of members to check with a single MGET
+
+        Returns:
+            int: The number of members removed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            members = list(self.redis_client.sscan_iter(name, count=chunk_size))
+            removed = 0
+            for start in range(0, len(members), chunk_size):
+                chunk = members[start:start + chunk_size]
+                values = self.redis_client.mget(chunk)
+                dead_members = [member for member, value in zip(chunk, values) if value is None]
+                if dead_members:
+                    removed += self.redis_client.srem(name, *dead_members)
+            logger.debug(f"Removed {removed} expired members from Redis set {name}")
+            return removed
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return 0
+
+    def pipeline(self) -> redis.client.Pipeline:
+        """
+        Create a non-transactional pipeline for batching commands into a single round-trip.
+        Commands are sent when the caller calls execute() on the returned pipeline.
+
+        Returns:
+            redis.client.Pipeline: A new pipeline on the shared connection pool
+        """
+        return self.redis_client.pipeline(transaction=False)
+
     def delete_cached_response(self, cache_key: str) -> bool:
         """
         Delete a cached response from Redis.
@@ -125,6 +524,68 @@ class RedisService:
             logger.error(f"Redis error: {e}")
             return False
 
+    def scan_iter_keys(self, pattern: str, count: int = REDIS_SCAN_COUNT) -> Iterator[bytes]:
+        """
+        Iterate over all keys matching the given pattern using Redis SCAN.
+        SCAN walks the keyspace incrementally, so unlike KEYS it never blocks the server.
+        Keys are yielded as they are returned by the server, so callers can
+        process them in streaming chunks without materializing the full list.
+
+        Args:
+            pattern: Pattern to match keys against (e.g., "prompt:*")
+            count: Number of keys to request from the server in each SCAN iteration
+
+        Yields:
+            bytes: Each matching key, as returned by Redis
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        logger.debug(f"Scanning Redis for keys matching pattern: {pattern}")
+        yield from self.redis_client.scan_iter(match=pattern, count=count)
+
+    def sscan_iter_members(self, name: str, count: int = REDIS_SCAN_COUNT) -> Iterator[bytes]:
+        """
+        Iterate over the members of a Redis set using SSCAN.
+        Members are yielded as they are returned by the server, so large sets can be
+        processed in streaming chunks without materializing them with SMEMBERS.
+
+        Args:
+            name: The key of the set
+            count: Number of members to request from the server in each SSCAN iteration
+
+        Yields:
+            bytes: Each member of the set, as returned by Redis
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        logger.debug(f"Scanning Redis set {name}")
+        yield from self.redis_client.sscan_iter(name, count=count)
+
+    def get_keys_raw(self, pattern: str) -> List[bytes]:
+        """
+        Get all keys matching the given pattern without decoding them.
+        Use this on hot paths where the keys are only passed back to Redis.
+
+        Args:
+            pattern: Pattern to match keys against (e.g., "prompt:*")
+
+        Returns:
+            List[bytes]: List of matching keys
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            keys = list(self.scan_iter_keys(pattern))
+            logger.debug(f"Found {len(keys)} keys matching pattern {pattern}")
+            return keys
+
+        except redis.RedisError as e:
+            logger.error(f"Redis error during key scan: {e}")
+            return []
+
     def get_keys(self, pattern: str) -> list:
         """
         Get all keys matching the given pattern using Redis SCAN for efficiency.
@@ -138,23 +599,95 @@ class RedisService:
         Raises:
             redis.RedisError: If there's an error connecting to Redis
         """
-        try:
-            logger.debug(f"Scanning Redis for keys matching pattern: {pattern}")
-            keys = []
-            cursor = 0
-            while True:
-                cursor, partial_keys = self.redis_client.scan(
-                    cursor=cursor,
-                    match=pattern,
-                    count=100  # Number of keys to return in each iteration
-                )
-                keys.extend(k.decode('utf-8') for k in partial_keys)
-                if cursor == 0:  # Scan complete
-                    break
+        return [key.decode('utf-8') for key in self.get_keys_raw(pattern)]
 
-            logger.debug(f"Found {len(keys)} keys matching pattern {pattern}")
-            return keys
+    def get_cached_responses(self, cache_keys: List[Union[str, bytes]],
+                             chunk_size: int = 500) -> List[Optional[bytes]]:
+        """
+        Get multiple cached responses from Redis with MGET.
+        Each chunk of keys is fetched with a single command and round-trip.
 
+        Args:
+            cache_keys: The keys to look up in Redis
+            chunk_size: Maximum number of keys to send in a single MGET
+
+        Returns:
+            List[Optional[bytes]]: The cached responses in the same order as cache_keys,
+                with None for keys that were not found. Empty if the operation failed.
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Fetching {len(cache_keys)} cache records from Redis")
+            values = []
+            for start in range(0, len(cache_keys), chunk_size):
+                values.extend(self.redis_client.mget(cache_keys[start:start + chunk_size]))
+            return values
         except redis.RedisError as e:
-            logger.error(f"Redis error during key scan: {e}")
+            logger.error(f"Redis error: {e}")
             return []
+
+    def mget_cached(self, pattern: str, chunk_size: int = 500) -> Dict[str, bytes]:
+        """
+        Get all cached responses whose keys match the given pattern.
+        Keys are found with SCAN and their values fetched with MGET,
+        one round-trip per chunk instead of one per key.
+
+        Args:
+            pattern: Pattern to match keys against (e.g., "prompt:*")
+            chunk_size: Maximum number of keys to fetch in a single MGET
+
+        Returns:
+            Dict[str, bytes]: Cached responses keyed by their Redis key. Keys that expire
+                between the scan and the fetch are omitted.
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        keys = self.get_keys(pattern)
+        if not keys:
+            return {}
+
+        values = self.get_cached_responses(keys, chunk_size)
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def mset_cached(self, mapping: Dict[str, Union[str, bytes]], ttl_seconds: int = CACHE_TTL_DEFAULT,
+                    chunk_size: int = 500) -> bool:
+        """
+        Cache multiple responses in Redis with a shared TTL.
+        Writes are sent as pipelined SETEX commands, one round-trip per chunk.
+
+        Args:
+            mapping: Responses to cache keyed by the Redis key to store them under
+            ttl_seconds: Time-to-live in seconds (default: global default TTL)
+            chunk_size: Maximum number of SETEX commands to send in a single pipeline
+
+        Returns:
+            bool: True if all responses were cached, False if operation failed
+
+        Raises:
+            redis.RedisError: If there's an error connecting to Redis
+        """
+        try:
+            logger.debug(f"Setting {len(mapping)} cache records to Redis")
+            pipe = self.redis_client.pipeline(transaction=False)
+            items = list(mapping.items())
+            for start in range(0, len(items), chunk_size):
+                for cache_key, response in items[start:start + chunk_size]:
+                    pipe.setex(cache_key, ttl_seconds, response)
+                pipe.execute()
+            return True
+        except redis.RedisError as e:
+            logger.error(f"Redis error: {e}")
+            return False
+
+
+def get_redis() -> RedisService:
+    """
+    Get the process-wide RedisService instance.
+
+    Returns:
+        RedisService: The singleton instance of the service
+    """
+    return RedisService()
@@ -1,10 +1,86 @@
 """Utility functions for IQ."""
+import functools
+import itertools
 import logging
+import math
+import operator
 import re
-from typing import Dict, Any, List, Set
+import string
+from collections import deque
+from typing import Dict, Any, Callable, FrozenSet, Iterator, List, Mapping, Optional
+
+from iq_bot_global.constants import REDIS_GENERATED_PROMPT_KEY
 
 logger = logging.getLogger(__name__)
 
+_TEMPLATE_PARAM_RE = re.compile(r'\{([^}]+)\}')
+
+
+@functools.lru_cache(maxsize=512)
+def compile_template(template_str: str) -> Callable[[Mapping[str, Any]], str]:
+    """
+    Compile a str.format template into a callable that formats it from a mapping.
+    Templates made only of plain {name} placeholders are parsed once into a %-style
+    pattern and an itemgetter, so formatting skips re-parsing the template.
+    Any other template falls back to str.format_map.
+    e.g., compile_template("spell:{spell}")({'spell': 'lumos'}) -> "spell:lumos"
+
+    Args:
+        template_str: The template string containing {param_name} placeholders
+
+    Returns:
+        Callable[[Mapping[str, Any]], str]: Formats the template from a mapping of parameters,
+            raising KeyError for a missing parameter like str.format
+    """
+    pattern_parts = []
+    fields = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template_str):
+        pattern_parts.append(literal.replace('%', '%%'))
+        if field_name is None:
+            continue
+        if format_spec or conversion or not field_name.isidentifier():
+            return template_str.format_map
+        pattern_parts.append('%s')
+        fields.append(field_name)
+
+    pattern = ''.join(pattern_parts)
+    if not fields:
+        text = pattern % ()
+        return lambda params: text
+    getter = operator.itemgetter(*fields)
+    if len(fields) == 1:
+        return lambda params: pattern % (getter(params),)
+    return lambda params: pattern % getter(params)
+
+
+def generated_prompt_key(template_id: str, prompt_id: str) -> str:
+    """
+    Build the Redis key for a generated prompt.
+    The template ID is wrapped in a hash tag so all prompts for a template share a cluster slot.
+    e.g., ("abc", "123") -> "iq:generated-prompt:{abc}:123"
+
+    Args:
+        template_id: ID of the template the prompt was generated from
+        prompt_id: ID of the generated prompt
+
+    Returns:
+        str: The Redis key for the generated prompt
+    """
+    return f"{REDIS_GENERATED_PROMPT_KEY}{{{template_id}}}:{prompt_id}"
+
+
+def generated_prompt_pattern(template_id: str) -> str:
+    """
+    Build the Redis key pattern matching every generated prompt for a template.
+
+    Args:
+        template_id: ID of the template the prompts were generated from
+
+    Returns:
+        str: The Redis key pattern for the template's generated prompts
+    """
+    return f"{REDIS_GENERATED_PROMPT_KEY}{{{template_id}}}:*"
+
 
 def extract_context_params(prompt_id: str, prompt_contexts: dict) -> Dict[str, Any]:
     """
@@ -20,16 +96,6 @@ def extract_context_params(prompt_id: str, prompt_contexts: dict) -> Dict[str, A
     """
     params = {'id': prompt_id}
 
-    def add_mapping(key: str, value: str, params: dict) -> None:
-        """
-        Add mappings for a single value to the params dict.
-
-        Args:
-            key: Base key name to use for mapped values
-            value: ID to look up in mapping service
-            params: Dictionary to add mapped values to.
-        """
-
     for context in prompt_contexts.get("promptContexts", []):
         param_key = context["name"].rstrip('s')
         values = context["values"]
@@ -37,21 +103,20 @@ def extract_context_params(prompt_id: str, prompt_contexts: dict) -> Dict[str, A
             continue
 
         # Store the primary value
-        value = values[0]
-        params[param_key] = value
-        add_mapping(param_key, value, params)
+        params[param_key] = values[0]
 
     return params
 
 
-def find_param_in_dict(param_name: str, data_dict: Dict[str, Any], path: str = '') -> tuple[bool, Any]:
+def find_param_in_dict(param_name: str, data_dict: Dict[str, Any]) -> tuple[bool, Any]:
     """
-    Recursively search for a parameter in a nested dictionary.
+    Search for a parameter in a nested dictionary.
+    Nested dictionaries and lists of dictionaries are walked breadth-first, so the
+    shallowest match wins.
 
     Args:
         param_name: The name of the parameter to find
         data_dict: The dictionary to search in
-        path: Current path in the nested structure (for debugging)
 
     Returns:
         tuple: (bool, Any) where bool indicates if parameter was found and Any is the value if found
@@ -59,31 +124,92 @@ def find_param_in_dict(param_name: str, data_dict: Dict[str, Any], path: str = '
     if not isinstance(data_dict, dict):
         return False, None
 
-    # Check direct key match
-    if param_name in data_dict:
-        # If the value is a dict and it has the same key name as a property, use that property
-        if isinstance(data_dict[param_name], dict) and param_name in data_dict[param_name]:
-            return True, data_dict[param_name][param_name]
-        return True, data_dict[param_name]
-
-    # Recursively check nested dictionaries
-    for key, value in data_dict.items():
-        new_path = f"{path}.{key}" if path else key
-        if isinstance(value, dict):
-            found, result = find_param_in_dict(param_name, value, new_path)
-            if found:
-                return True, result
+    queue = deque([data_dict])
+    while queue:
+        current = queue.popleft()
+        if isinstance(current, dict):
+            # Check direct key match
+            if param_name in current:
+                value = current[param_name]
+                # If the value is a dict and it has the same key name as a property, use that property
+                if isinstance(value, dict) and param_name in value:
+                    return True, value[param_name]
+                return True, value
+            queue.extend(current.values())
         # Check if value is a list of dictionaries
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    found, result = find_param_in_dict(param_name, item, f"{new_path}[{i}]")
-                    if found:
-                        return True, result
+        elif isinstance(current, list):
+            queue.extend(current)
 
     return False, None
 
 
+def _flatten_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten nested parameters into a single lookup of parameter name to value.
+    Walks the structure once, breadth-first, applying the same matching rules as
+    find_param_in_dict so that flat[name] equals find_param_in_dict(name, params).
+
+    Args:
+        params: Dictionary containing parameters, possibly nested in dicts and lists
+
+    Returns:
+        Dict[str, Any]: Parameter values keyed by name, shallowest match first
+    """
+    flat = {}
+    queue = deque([params])
+    while queue:
+        current = queue.popleft()
+        if isinstance(current, dict):
+            for key, value in current.items():
+                if key not in flat:
+                    # If the value is a dict and it has the same key name as a property, use that property
+                    flat[key] = value[key] if isinstance(value, dict) and key in value else value
+            queue.extend(current.values())
+        elif isinstance(current, list):
+            queue.extend(current)
+    return flat
+
+
+def _top_level_params(template_str: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Resolve the template parameters directly from the top level of params, if they are all there.
+    Applies the same matching rules as _flatten_params, so the values are identical, but
+    skips walking nested dictionaries and lists.
+
+    Args:
+        template_str: The template string containing {param_name} placeholders
+        params: Dictionary containing parameters, possibly nested in dicts and lists
+
+    Returns:
+        Optional[Dict[str, Any]]: Parameter values keyed by name, or None if any parameter is
+            not a top-level key and the nested params have to be searched
+    """
+    required = extract_template_params(template_str)
+    if not params.keys() >= required:
+        return None
+
+    top_level = {}
+    for name in required:
+        value = params[name]
+        # If the value is a dict and it has the same key name as a property, use that property
+        top_level[name] = value[name] if isinstance(value, dict) and name in value else value
+    return top_level
+
+
+def _missing_template_params(template_str: str, flat_params: Dict[str, Any]) -> List[str]:
+    """
+    List the template parameters that have no value in the flattened params.
+
+    Args:
+        template_str: The template string containing {param_name} placeholders
+        flat_params: Parameters flattened with _flatten_params
+
+    Returns:
+        List[str]: Names of the missing parameters
+    """
+    return [param for param in extract_template_params(template_str) if param not in flat_params]
+
+
 def format_template_with_nested_params(template_str: str, params: Dict[str, Any]) -> str:
     """
     Format a template string using parameters that may be nested in dictionaries.
@@ -95,21 +221,43 @@ def format_template_with_nested_params(template_str: str, params: Dict[str, Any]
     Returns:
         str: The formatted string with all parameters replaced
     """
-    format_params = {}
-    required_params = extract_template_params(template_str)
+    flat_params = _top_level_params(template_str, params)
+    if flat_params is None:
+        flat_params = _flatten_params(params)
+    return compile_template(template_str)(flat_params)
+
+
+def format_validated_template(template_str: str, params: Dict[str, Any]) -> Optional[str]:
+    """
+    Validate and format a template string in a single pass over the params.
+    Equivalent to validate_template_params followed by format_template_with_nested_params,
+    but the nested params are only walked once, and not at all when every parameter is a
+    top-level key.
+
+    Args:
+        template_str: The template string containing {param_name} placeholders
+        params: Dictionary containing parameters for template formatting, possibly nested
+
+    Returns:
+        Optional[str]: The formatted string, or None if a required parameter is missing
+    """
+    top_level = _top_level_params(template_str, params)
+    if top_level is not None:
+        return compile_template(template_str)(top_level)
 
-    for param in required_params:
-        found, value = find_param_in_dict(param, params)
-        if found:
-            format_params[param] = value
+    flat_params = _flatten_params(params)
+    missing = _missing_template_params(template_str, flat_params)
+    if missing:
+        logger.warning(f"Missing required parameter '{missing[0]}' in template params")
+        return None
 
-    return template_str.format(**format_params)
+    return compile_template(template_str)(flat_params)
 
 
 def validate_template_params(template_str: str, params: Dict[str, Any]) -> bool:
     """
     Validate that all required template parameters are available in the params dictionary.
-    Recursively searches through nested dictionaries and lists to find parameters.
+    Searches through nested dictionaries and lists to find parameters.
 
     Args:
         template_str: The template string containing {param_name} placeholders
@@ -118,29 +266,63 @@ def validate_template_params(template_str: str, params: Dict[str, Any]) -> bool:
     Returns:
         True if all required parameters are available, False otherwise
     """
-    required_params = extract_template_params(template_str)
-
-    for param in required_params:
-        found, _ = find_param_in_dict(param, params)
-        if not found:
-            logger.warning(f"Missing required parameter '{param}' in template params")
-            return False
+    missing = _missing_template_params(template_str, _flatten_params(params))
+    if missing:
+        logger.warning(f"Missing required parameter '{missing[0]}' in template params")
+        return False
 
     return True
 
 
-def extract_template_params(template_str: str) -> Set[str]:
+@functools.lru_cache(maxsize=512)
+def extract_template_params(template_str: str) -> FrozenSet[str]:
     """
     Extract parameter names from a template string.
     e.g., "prompt:{id}:team:{team}:season:{season}" -> {'id', 'team', 'season'}
+    Results are memoized since the same template strings are parsed repeatedly.
 
     Args:
         template_str: The template string containing parameters in {param_name} format
 
     Returns:
-        Set[str]: Set of unique parameter names found in the template
+        FrozenSet[str]: Set of unique parameter names found in the template
+    """
+    return frozenset(_TEMPLATE_PARAM_RE.findall(template_str))
+
+
+def iter_param_combinations(data_sources: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield all combinations of parameters based on data sources.
+    Only one combination is held in memory at a time, however large the Cartesian product.
+
+    Args:
+        data_sources: Dictionary mapping parameter names to their possible values
+            e.g., {'team': [team1, team2], 'season': [2023, 2024]}
+
+    Yields:
+        Dict[str, Any]: Each parameter combination, or a single empty combination
+            if no parameters are needed or there are no combinations
+    """
+    keys = list(data_sources.keys())
+    combination = None
+    for combination in itertools.product(*data_sources.values()):
+        yield dict(zip(keys, combination))
+
+    if combination is None:
+        yield {}  # Yield single empty combination if there were no combinations
+
+
+def count_param_combinations(data_sources: Dict[str, Any]) -> int:
+    """
+    Count the combinations iter_param_combinations yields, without generating them.
+
+    Args:
+        data_sources: Dictionary mapping parameter names to their possible values
+
+    Returns:
+        int: Number of parameter combinations
     """
-    return set(re.findall(r'\{([^}]+)\}', template_str))
+    return math.prod(len(values) for values in data_sources.values()) or 1
 
 
 def generate_param_combinations(data_sources: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -155,26 +337,4 @@ def generate_param_combinations(data_sources: Dict[str, Any]) -> List[Dict[str,
         List[Dict[str, Any]]: List of parameter combinations
             e.g., [{'team': team1, 'season': 2023}, {'team': team1, 'season': 2024}, ...]
     """
-    if not data_sources:
-        return [{}]  # Return single empty combination if no parameters needed
-
-    # Convert data sources into list of (key, values) pairs
-    items = list(data_sources.items())
-    if not items:
-        return [{}]
-
-    # Start with first parameter's values
-    param_name, values = items[0]
-    combinations = [{param_name: value} for value in values]
-
-    # Add each additional parameter's values
-    for param_name, values in items[1:]:
-        new_combinations = []
-        for combo in combinations:
-            for value in values:
-                new_combo = combo.copy()
-                new_combo[param_name] = value
-                new_combinations.append(new_combo)
-        combinations = new_combinations
-
-    return combinations if combinations else [{}]
+    return list(iter_param_combinations(data_sources))
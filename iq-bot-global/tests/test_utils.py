@@ -0,0 +1,89 @@
+"""Tests for the template helpers in iq_bot_global.utils."""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from iq_bot_global.utils import (  # noqa: E402
+    _flatten_params,
+    _top_level_params,
+    compile_template,
+    find_param_in_dict
+)
+
+TEMPLATE_PARAMS = {
+    'id': 'p1',
+    'team': 'gryffindor',
+    'season': 2024,
+    'spell': {'spell': 'lumos', 'type': 'charm'},
+    'house': {'name': 'ravenclaw'},
+    'scores': [10, 20],
+}
+
+
+class CompileTemplateTest(unittest.TestCase):
+    """compile_template must format exactly like str.format."""
+
+    def test_matches_str_format(self):
+        templates = [
+            "",
+            "no placeholders",
+            "100% done",
+            "prompt:{id}",
+            "prompt:{id}:team:{team}:season:{season}",
+            "{team} vs {team}",
+            "{id}% of {season}",
+            "{{literal}} {id}",
+            "spell:{spell}",
+            "{season:>6}|{team!r}",
+            "{house[name]} {scores[1]}",
+        ]
+        for template in templates:
+            with self.subTest(template=template):
+                self.assertEqual(compile_template(template)(TEMPLATE_PARAMS), template.format(**TEMPLATE_PARAMS))
+
+    def test_missing_param_raises_key_error(self):
+        for template in ["prompt:{missing}", "{id}:{missing}", "{missing:>4}"]:
+            with self.subTest(template=template):
+                with self.assertRaises(KeyError) as expected:
+                    template.format(**TEMPLATE_PARAMS)
+                with self.assertRaises(KeyError) as compiled:
+                    compile_template(template)(TEMPLATE_PARAMS)
+                self.assertEqual(compiled.exception.args, expected.exception.args)
+
+
+class ParamLookupTest(unittest.TestCase):
+    """_top_level_params and _flatten_params must resolve the same values as find_param_in_dict."""
+
+    def test_top_level_params_match_find_param_in_dict(self):
+        params = {
+            'id': 'p1',
+            'spell': {'spell': 'lumos', 'type': 'charm'},
+            'house': {'name': 'ravenclaw'},
+            'nested': {'team': 'slytherin'},
+        }
+        top_level = _top_level_params("{id}:{spell}:{house}", params)
+        self.assertEqual(top_level, {
+            name: find_param_in_dict(name, params)[1] for name in ('id', 'spell', 'house')
+        })
+
+    def test_top_level_params_none_for_nested_param(self):
+        self.assertIsNone(_top_level_params("{id}:{team}", {'id': 'p1', 'nested': {'team': 'slytherin'}}))
+
+    def test_flatten_params_match_find_param_in_dict(self):
+        params = {
+            'id': 'p1',
+            'nested': {'team': 'slytherin', 'deeper': {'id': 'shadowed', 'season': 2023}},
+            'items': [{'spell': {'spell': 'lumos'}}, {'spell': 'nox', 'wand': 'elder'}],
+        }
+        flat = _flatten_params(params)
+        for name in ('id', 'nested', 'team', 'deeper', 'season', 'items', 'spell', 'wand'):
+            with self.subTest(name=name):
+                self.assertEqual((name in flat, flat.get(name)), find_param_in_dict(name, params))
+        self.assertEqual(find_param_in_dict('missing', params), (False, None))
+        self.assertNotIn('missing', flat)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""orjson-backed JSON provider for the Flask app."""
+from typing import Any, Union
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes with orjson instead of the standard library json module."""
+
+    mimetype = "application/json"
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj: The data to serialize
+
+        Returns:
+            str: The JSON document
+        """
+        return orjson.dumps(obj, option=self.option).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON.
+
+        Args:
+            s: Text or UTF-8 bytes
+
+        Returns:
+            Any: The decoded data
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments as JSON and return a response with the application/json mimetype.
+        The orjson bytes are used as the response body directly, without decoding to str first.
+
+        Returns:
+            Response: The JSON response
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype=self.mimetype)
@@ -1,7 +1,9 @@
-import json
 import logging
+from typing import Iterable, Iterator
 
-from flask import Blueprint, jsonify, request
+import msgpack
+import orjson
+from flask import Blueprint, Response, jsonify, request
 from services.prompt_reader_service import PromptReaderService
 
 from iq_bot_global import (
@@ -14,8 +16,30 @@ from iq_bot_global.constants import (
 
 logger = logging.getLogger(__name__)
 
+MSGPACK_MIMETYPE = 'application/msgpack'
+
 api = Blueprint('api', __name__)
 prompt_reader_service = PromptReaderService()
+redis_service = RedisService()
+
+
+def _pack_prompts(prompts: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Pack prompts into MessagePack one at a time for a streamed response.
+    The prompts are fetched while the response is sent, after the route has returned,
+    so a failure is logged here and ends the stream.
+
+    Args:
+        prompts: The prompts to stream
+
+    Yields:
+        bytes: Each MessagePack encoded prompt
+    """
+    try:
+        for prompt in prompts:
+            yield msgpack.packb(prompt)
+    except Exception as e:
+        logger.error(f"Error streaming prompts: {e}")
 
 
 @api.route('/api/v1/prompts', methods=['GET'])
@@ -24,6 +48,8 @@ def get_prompts():
     List Available Prompts
     
     Retrieves all available prompts from the system, optionally filtered by topic.
+    Clients that prefer application/msgpack receive a stream of MessagePack encoded
+    prompt objects instead of a JSON document.
     
     Args:
         topic (str, optional): Filter prompts by topic name (via query parameter)
@@ -38,6 +64,9 @@ def get_prompts():
     ---
     tags:
       - Prompts
+    produces:
+      - application/json
+      - application/msgpack
     parameters:
       - in: query
         name: topic
@@ -56,13 +85,20 @@ def get_prompts():
     """
     topic = request.args.get('topic')
     try:
+        if request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE:
+            if topic:
+                prompts = prompt_reader_service.iter_generated_prompts_by_topic(topic)
+            else:
+                prompts = prompt_reader_service.iter_generated_prompts()
+            # Stream one packed prompt at a time so the client can start reading before all are fetched
+            return Response(_pack_prompts(prompts), status=200, mimetype=MSGPACK_MIMETYPE)
+
         if topic:
-            prompts = prompt_reader_service.get_generated_prompts_by_topic(topic)
+            prompts = prompt_reader_service.get_generated_prompts_by_topic_raw(topic)
         else:
-            prompts = prompt_reader_service.get_all_generated_prompts()
-        return jsonify({
-            "prompts": prompts
-        }), 200
+            prompts = prompt_reader_service.get_all_generated_prompts_raw()
+        # The cached prompts are already validated JSON documents, so join them into the response as-is
+        return Response(b'{"prompts":[' + b','.join(prompts) + b']}', status=200, mimetype='application/json')
     except Exception as e:
         logger.error(f"Error getting prompts: {e}")
         return jsonify({
@@ -99,18 +135,20 @@ def get_prompt(prompt_id):
     """
     try:
         # Check Redis for the generated prompt
-        redis_service = RedisService()
-        cache_keys = redis_service.get_keys(f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:*{prompt_id}")
-        if not cache_keys:
+        cache_key = redis_service.hget_cached(REDIS_KEYS.PROMPT_INDEX, prompt_id)
+        if not cache_key:
             return jsonify({"error": API_RESPONSE_MESSAGES.PROMPT_NOT_FOUND_WITH_ID.format(prompt_id=prompt_id)}), 404
 
-        cached_prompt = redis_service.get_cached_response(cache_keys[0])
+        cached_prompt = redis_service.get_cached_response(cache_key)
         if cached_prompt:
             try:
-                return jsonify(json.loads(cached_prompt)), 200
-            except json.JSONDecodeError:
+                orjson.loads(cached_prompt)
+            except orjson.JSONDecodeError:
                 logger.error("Failed to decode cached prompt")
-                redis_service.delete_cached_response(f"{REDIS_KEYS.PROMPT_PREFIX}:{prompt_id}")
+                redis_service.delete_cached_response(cache_key)
+            else:
+                # The cached prompt is already a JSON document, so return it without re-encoding
+                return Response(cached_prompt, status=200, mimetype='application/json')
 
     except Exception as e:
         logger.error(f"Error retrieving prompt {prompt_id}: {e}")
@@ -155,18 +193,17 @@ def query():
 
     try:
         # Check Redis for the generated response
-        redis_service = RedisService()
-        cache_keys = redis_service.get_keys(f"{REDIS_KEYS.PROMPT_PREFIX}:{prompt_id}:*")
-        if not cache_keys:
+        cache_key = redis_service.hget_cached(REDIS_KEYS.RESPONSE_INDEX, prompt_id)
+        if not cache_key:
             return jsonify({"error": API_RESPONSE_MESSAGES.RESPONSE_NOT_FOUND_WITH_ID.format(prompt_id=prompt_id)}), 404
 
-        cached_response = redis_service.get_cached_response(cache_keys[0])
+        cached_response = redis_service.get_cached_response(cache_key)
         if cached_response:
             try:
                 return jsonify({"response": cached_response.decode('utf-8')}), 200
-            except json.JSONDecodeError:
+            except UnicodeDecodeError:
                 logger.error("Failed to decode cached response")
-                redis_service.delete_cached_response(cache_keys[0])
+                redis_service.delete_cached_response(cache_key)
                 return jsonify({"error": API_RESPONSE_MESSAGES.DEFAULT_ERROR}), 500
 
     except Exception as e:
@@ -1,3 +1,33 @@
+from flasgger import Swagger
+
+
+def _include_all(_) -> bool:
+    """Spec filter that includes every rule and model."""
+    return True
+
+
+class CachedSwagger(Swagger):
+    """Swagger extension that builds each spec once and reuses it for later requests."""
+
+    def __init__(self, *args, **kwargs):
+        self._spec_cache = {}
+        super().__init__(*args, **kwargs)
+
+    def get_apispecs(self, endpoint='apispec_1'):
+        """
+        Get the spec for an endpoint, building it on first use.
+
+        Args:
+            endpoint: The spec endpoint name from the Swagger config
+
+        Returns:
+            dict: The generated spec
+        """
+        if endpoint not in self._spec_cache:
+            self._spec_cache[endpoint] = super().get_apispecs(endpoint)
+        return self._spec_cache[endpoint]
+
+
 SWAGGER_TEMPLATE = {
     "swagger": "2.0",
     "info": {
@@ -49,8 +79,8 @@ SWAGGER_CONFIG = {
         {
             "endpoint": "openapi",
             "route": "/openapi.json",
-            "rule_filter": lambda rule: True,
-            "model_filter": lambda tag: True
+            "rule_filter": _include_all,
+            "model_filter": _include_all
         }
     ],
     "static_url_path": "/flasgger_static",
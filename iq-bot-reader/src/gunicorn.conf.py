@@ -0,0 +1,24 @@
+"""Gunicorn configuration for the reader API.
+
+Run from this directory with: gunicorn wsgi:app
+"""
+# Patch before the app is preloaded, so locks created at import time in the master are gevent-aware
+from gevent import monkey
+
+monkey.patch_all()
+
+import multiprocessing
+import os
+
+from iq_bot_global.constants import FLASK_CONFIG
+
+bind = f"{FLASK_CONFIG.DEFAULT_HOST}:{os.getenv('PORT', FLASK_CONFIG.DEFAULT_PORT)}"
+
+# One worker process per CPU, each multiplexing many concurrent requests on gevent
+# so that requests waiting on Redis overlap instead of queueing
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gevent'
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# Build the app, including the Swagger setup, once in the master so forked workers share it copy-on-write
+preload_app = True
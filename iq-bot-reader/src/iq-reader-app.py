@@ -1,11 +1,11 @@
 import logging
 import os
 
-from flasgger import Swagger
 from flask import Flask
 
+from api.json_provider import OrjsonProvider
 from api.routes import api
-from api.swagger_template import SWAGGER_TEMPLATE, SWAGGER_CONFIG
+from api.swagger_template import SWAGGER_TEMPLATE, SWAGGER_CONFIG, CachedSwagger
 from iq_bot_global.constants import FLASK_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -14,8 +14,10 @@ logger = logging.getLogger(__name__)
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
     app.register_blueprint(api)
-    Swagger(app, template=SWAGGER_TEMPLATE, config=SWAGGER_CONFIG)
+    CachedSwagger(app, template=SWAGGER_TEMPLATE, config=SWAGGER_CONFIG)
     return app
 
 
@@ -28,4 +30,6 @@ if __name__ == '__main__':
 
     app = create_app()
     port = int(os.getenv('PORT', FLASK_CONFIG.DEFAULT_PORT))
-    app.run(host=FLASK_CONFIG.DEFAULT_HOST, port=port, debug=True)
+    # Debug mode is opt-in, so the dev server runs without the reloader and debugger by default
+    debug = os.getenv('FLASK_DEBUG') == '1'
+    app.run(host=FLASK_CONFIG.DEFAULT_HOST, port=port, debug=debug)
@@ -1,9 +1,11 @@
 """Service for fetching prompts."""
-import json
 import logging
-from typing import Dict, Any, List
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 
-from iq_bot_global.constants import REDIS_KEYS
+import orjson
+
+from iq_bot_global.constants import REDIS_KEYS, REDIS_SCAN_COUNT
 from iq_bot_global.services.redis_service import RedisService
 
 logger = logging.getLogger(__name__)
@@ -22,46 +24,176 @@ class PromptReaderService:
         Returns:
             List[Dict[str, Any]]: List of all cached prompts
         """
-        # Get all prompt keys using Redis pattern matching
-        prompt_keys = self.redis_service.get_keys(f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:*")
+        # Get all prompts in one pipelined fetch using Redis pattern matching
+        cached_prompts = self.redis_service.mget_cached(f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:*")
 
-        if not prompt_keys:
+        if not cached_prompts:
             logger.error("No prompts found")
             return []
 
         prompts = []
-        for key in prompt_keys:
-            cached_prompt = self.redis_service.get_cached_response(key)
+        for key, cached_prompt in cached_prompts.items():
             if cached_prompt:
                 try:
-                    prompts.append(json.loads(cached_prompt))
-                except json.JSONDecodeError:
+                    prompts.append(orjson.loads(cached_prompt))
+                except orjson.JSONDecodeError:
                     logger.error(f"Failed to decode cached prompt for key {key}")
                     continue
 
         return prompts
 
+    def get_all_generated_prompts_raw(self) -> List[bytes]:
+        """
+        Get all available prompts from cache as the raw JSON documents stored in Redis.
+        Use this when the prompts are only passed through, to skip re-encoding them.
+        Each document is still parsed once, so corrupt entries are skipped rather than
+        passed on to the caller.
+
+        Returns:
+            List[bytes]: List of all cached prompts, each a valid JSON document
+        """
+        cached_prompts = self.redis_service.mget_cached(f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:*")
+
+        if not cached_prompts:
+            logger.error("No prompts found")
+            return []
+
+        return self._valid_raw_prompts(cached_prompts.items())
+
+    def get_generated_prompts_by_topic_raw(self, topic: str) -> List[bytes]:
+        """
+        Get the prompts of a topic as the raw JSON documents stored in Redis.
+        Only the prompts listed in the topic's index set are fetched, and like
+        get_all_generated_prompts_raw they are validated but not re-encoded.
+
+        Args:
+            topic: The topic to filter prompts by
+
+        Returns:
+            List[bytes]: List of the topic's cached prompts, each a valid JSON document
+        """
+        prompt_keys = self.redis_service.smembers_cached(f"{REDIS_KEYS.TOPIC_INDEX_PREFIX}:{topic}")
+        if not prompt_keys:
+            logger.error("No prompts found")
+            return []
+
+        cached_prompts = self.redis_service.get_cached_responses(prompt_keys)
+        if len(cached_prompts) != len(prompt_keys):
+            logger.error(f"Failed to fetch the prompts of topic {topic}")
+            return []
+
+        return self._valid_raw_prompts(
+            (key, cached_prompt) for key, cached_prompt in zip(prompt_keys, cached_prompts) if cached_prompt)
+
+    @staticmethod
+    def _valid_raw_prompts(cached_prompts: Iterable[Tuple[Any, bytes]]) -> List[bytes]:
+        """
+        Keep the cached prompts that are valid JSON documents, logging the corrupt ones.
+
+        Args:
+            cached_prompts: (Redis key, cached prompt) pairs
+
+        Returns:
+            List[bytes]: The valid cached prompts, as stored in Redis
+        """
+        prompts = []
+        for key, cached_prompt in cached_prompts:
+            try:
+                orjson.loads(cached_prompt)
+            except orjson.JSONDecodeError:
+                logger.error(f"Failed to decode cached prompt for key {key}")
+                continue
+            prompts.append(cached_prompt)
+
+        return prompts
+
+    def iter_generated_prompts(self, chunk_size: int = REDIS_SCAN_COUNT) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all available prompts from cache without loading them all at once.
+        Keys are scanned and fetched in chunks, so the first prompts are yielded
+        while later ones are still being read from Redis.
+
+        Args:
+            chunk_size: Number of prompts to fetch from Redis at a time
+
+        Yields:
+            Dict[str, Any]: Each cached prompt
+
+        Raises:
+            Exception: If a chunk of prompts cannot be fetched from Redis
+        """
+        keys = self.redis_service.scan_iter_keys(f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:*", chunk_size)
+        yield from self._iter_prompt_chunks(keys, chunk_size)
+
+    def iter_generated_prompts_by_topic(self, topic: str,
+                                        chunk_size: int = REDIS_SCAN_COUNT) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the prompts of a topic without loading them all at once.
+        The topic's index set is scanned and its prompts fetched in chunks.
+
+        Args:
+            topic: The topic to filter prompts by
+            chunk_size: Number of prompts to fetch from Redis at a time
+
+        Yields:
+            Dict[str, Any]: Each cached prompt of the topic
+
+        Raises:
+            Exception: If a chunk of prompts cannot be fetched from Redis
+        """
+        keys = self.redis_service.sscan_iter_members(f"{REDIS_KEYS.TOPIC_INDEX_PREFIX}:{topic}", chunk_size)
+        yield from self._iter_prompt_chunks(keys, chunk_size)
+
+    def _iter_prompt_chunks(self, keys: Iterator[bytes], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch and decode the prompts under the given keys, one MGET per chunk of keys.
+        A chunk that cannot be fetched ends the iteration with an error rather than being
+        skipped, so a partial listing is never passed off as complete.
+
+        Args:
+            keys: The Redis keys of the prompts
+            chunk_size: Number of prompts to fetch from Redis at a time
+
+        Yields:
+            Dict[str, Any]: Each cached prompt still in Redis
+
+        Raises:
+            Exception: If a chunk of prompts cannot be fetched from Redis
+        """
+        while True:
+            chunk = list(islice(keys, chunk_size))
+            if not chunk:
+                return
+            cached_prompts = self.redis_service.get_cached_responses(chunk)
+            if len(cached_prompts) != len(chunk):
+                raise Exception(f"Failed to fetch {len(chunk)} prompts from Redis")
+            for key, cached_prompt in zip(chunk, cached_prompts):
+                if cached_prompt:
+                    try:
+                        yield orjson.loads(cached_prompt)
+                    except orjson.JSONDecodeError:
+                        logger.error(f"Failed to decode cached prompt for key {key}")
+                        continue
+
     def get_generated_prompts_by_topic(self, topic: str) -> List[Dict[str, Any]]:
         """
         Get a list of prompts filtered by topic.
+        Only the prompts listed in the topic's index set are fetched and decoded.
         Args:
             topic (str): The topic to filter prompts by
         Returns:
             List[Dict[str, Any]]: List of prompts matching the topic
         """
-        prompt_keys = self.redis_service.get_keys(f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:*")
+        prompt_keys = self.redis_service.smembers_cached(f"{REDIS_KEYS.TOPIC_INDEX_PREFIX}:{topic}")
         if not prompt_keys:
             logger.error("No prompts found")
             return []
         prompts = []
-        for key in prompt_keys:
-            cached_prompt = self.redis_service.get_cached_response(key)
+        for key, cached_prompt in zip(prompt_keys, self.redis_service.get_cached_responses(prompt_keys)):
             if cached_prompt:
                 try:
-                    prompt = json.loads(cached_prompt)
-                    if prompt.get("topic") == topic:
-                        prompts.append(prompt)
-                except json.JSONDecodeError:
+                    prompts.append(orjson.loads(cached_prompt))
+                except orjson.JSONDecodeError:
                     logger.error(f"Failed to decode cached prompt for key {key}")
                     continue
         return prompts
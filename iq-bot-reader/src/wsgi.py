@@ -0,0 +1,11 @@
+"""WSGI entry point for serving the reader with gunicorn."""
+import importlib
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# The application module name contains hyphens, so it has to be imported by name
+app = importlib.import_module('iq-reader-app').create_app()
@@ -5,7 +5,6 @@ import os
 
 from dotenv import load_dotenv
 
-from iq_bot_global.constants import REDIS_GENERATED_PROMPT_KEY
 from iq_bot_global.services.redis_service import RedisService
 from services.api.client import ApiClient
 from services.prompt_service import PromptService
@@ -54,11 +53,17 @@ def main():
 
     writer_service = WriterService()
     template_service = PromptTemplateService()
+    total_prompts_processed = 0
 
     try:
+        # Responses of the OpenAI batch jobs that finished since the last run are cached before the lookups
+        collected = writer_service.collect_batch_jobs()
+        if collected:
+            logger.info(f"Cached {collected} responses from OpenAI batch jobs")
+
         # Get all templates directly from template service
         templates = template_service.load_templates()
-        total_prompts_processed = 0
+        template_ids = []
 
         # Loop through all topics and their templates
         for topic, topic_templates in templates.items():
@@ -73,46 +78,36 @@ def main():
                     logger.warning(f"Invalid template in topic {topic}, skipping")
                     continue
 
-                template_id = template['id']
-                logger.info(f"Processing template {template_id}")
-
-                # Get all prompts for this template from Redis
-                prompt_keys = redis_service.get_keys(f"{REDIS_GENERATED_PROMPT_KEY}{template_id}:*")
-
-                if not prompt_keys:
-                    logger.warning(f"No prompts found for template {template_id}")
-                    continue
-
-                logger.info(f"Found {len(prompt_keys)} prompts for template {template_id}")
+                logger.info(f"Processing template {template['id']}")
+                template_ids.append(template['id'])
 
-                # Generate responses for each prompt
-                successful_prompts = 0
-                for prompt_key in prompt_keys:
-                    try:
-                        # Extract prompt ID from key format "iq:generated-prompt:template_id:prompt_id"
-                        parts = prompt_key.split(":")
-                        if len(parts) < 4:
-                            logger.error(f"Invalid prompt key format: {prompt_key}")
-                            continue
-                        # Take the last two parts as template_id and prompt_id
-                        template_id_from_key, prompt_id = parts[-2:]
-
-                        logger.info(f"Generating response for prompt {prompt_id} (template: {template_id})")
-                        response = writer_service.generate_prompt_response(template_id, prompt_id)
-                        logger.info(f"Successfully generated response {response} for prompt {prompt_id}")
-
-                        successful_prompts += 1
-                        total_prompts_processed += 1
-
-                    except Exception as e:
-                        logger.error(f"Error generating response for prompt {prompt_id}: {e}")
-                        continue
+        # Every template's prompts are queued before any result is awaited, so the pool stays busy across templates
+        for template_id, responses in writer_service.generate_responses_by_templates(template_ids).items():
+            if not responses:
+                logger.warning(f"No prompts found for template {template_id}")
+                continue
 
-                logger.info(
-                    f"Completed template {template_id}: {successful_prompts}/{len(prompt_keys)} prompts processed successfully")
+            successful_prompts = 0
+            pending_prompts = 0
+            for response in responses:
+                # Failed prompts are logged by the writer service as they are collected
+                if "pending" in response:
+                    pending_prompts += 1
+                elif "error" not in response:
+                    logger.info(f"Successfully generated response for prompt {response['prompt_id']}")
+                    successful_prompts += 1
+            total_prompts_processed += successful_prompts
+
+            logger.info(
+                f"Completed template {template_id}: {successful_prompts}/{len(responses)} prompts processed successfully"
+                + (f", {pending_prompts} pending in OpenAI batch jobs" if pending_prompts else ""))
 
     except Exception as e:
         logger.error(f"Error in batch response generation: {e}")
+    finally:
+        writer_service.shutdown()
+        # Send any API cache writes still queued for Redis
+        redis_service.flush()
 
     logger.info(f"Finishing iq-bot-writer at {datetime.datetime.now()}")
     logger.info(f"Total prompts processed successfully: {total_prompts_processed}")
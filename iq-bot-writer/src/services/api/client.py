@@ -1,27 +1,60 @@
 """API client for accessing team-related endpoints."""
 
-import json
+import functools
 import logging
-from typing import Optional, Dict
+import threading
+from typing import Any, Optional, Dict, Tuple
 
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 
-from iq_bot_global import RedisService
+from iq_bot_global import get_redis
 from iq_bot_global.constants import REDIS_KEYS
 from .config import ApiConfig
-from .endpoints import get_endpoint_path, get_endpoint_ttl
+from .endpoints import LOCAL_CACHE_SIZE, LOCAL_CACHE_TTL_SECONDS, get_endpoint_path, get_endpoint_ttl
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _build_cache_key(endpoint_name: str, params: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Build the cache key for an endpoint and its sorted parameters.
+    Memoized, since the writer requests the same endpoints repeatedly.
+
+    Args:
+        endpoint_name: Name of the endpoint being called
+        params: The endpoint parameters as sorted (name, value) pairs
+
+    Returns:
+        str: The cache key, ending in 'all' when there are no parameters
+    """
+    if not params:
+        return f"{REDIS_KEYS.API_CACHE_PREFIX}:{endpoint_name}:all"
+    param_string = ':'.join([f"{k}:{v}" for k, v in params])
+    return f"{REDIS_KEYS.API_CACHE_PREFIX}:{endpoint_name}:{param_string}"
+
+
 class ApiClient:
     """Simple client for interacting with the API."""
 
+    # Decoded responses shared by all clients in the process, checked before Redis
+    _local_cache = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL_SECONDS)
+    _local_cache_lock = threading.Lock()
+    # One lock per cache key being fetched, so concurrent callers for the same request share one fetch
+    _request_locks: Dict[str, threading.Lock] = {}
+
     def __init__(self, config: Optional[ApiConfig] = None):
         """Initialize the API client."""
         self.config = config or ApiConfig()
         self.session = requests.Session()
-        self.redis_service = RedisService()
+        # Size the connection pool for concurrent callers, so connections are reused instead of discarded
+        adapter = HTTPAdapter(pool_connections=self.config.pool_connections, pool_maxsize=self.config.pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.redis_service = get_redis()
 
     def _generate_cache_key(self, endpoint_name: str, **kwargs) -> str:
         """
@@ -36,10 +69,12 @@ class ApiClient:
             str: A unique, deterministic cache key.
         """
         # Sort kwargs for consistent cache keys
-        param_string = ':'.join(f"{k}:{v}" for k, v in sorted(kwargs.items()))
-        if param_string is None or len(param_string) == 0:
-            param_string = 'all'
-        return f"{REDIS_KEYS.API_CACHE_PREFIX}:{endpoint_name}:{param_string}"
+        params = tuple(sorted(kwargs.items()))
+        try:
+            return _build_cache_key(endpoint_name, params)
+        except TypeError:
+            # Unhashable parameter values cannot be memoized, so build the key directly
+            return _build_cache_key.__wrapped__(endpoint_name, params)
 
     def _make_request(self, endpoint_name: str, **kwargs) -> Dict:
         """
@@ -57,7 +92,7 @@ class ApiClient:
         Raises:
             requests.exceptions.RequestException: If API request fails
             requests.exceptions.HTTPError: If API returns non-200 status
-            json.JSONDecodeError: If response is not valid JSON
+            orjson.JSONDecodeError: If response is not valid JSON
             KeyError: If endpoint configuration is missing.
         """
         # Get endpoint path and TTL
@@ -67,33 +102,84 @@ class ApiClient:
         # Generate cache key
         cache_key = self._generate_cache_key(endpoint_name, **kwargs)
 
-        # Try to get from cache first
+        # Try the in-process cache first
+        with self._local_cache_lock:
+            local_response = self._local_cache.get(cache_key)
+            if local_response is None:
+                request_lock = self._request_locks.setdefault(cache_key, threading.Lock())
+        if local_response is not None:
+            logger.debug(f"Local cache hit for {endpoint_name}")
+            return local_response
+
+        with request_lock:
+            # Another caller may have fetched the same response while this one waited
+            with self._local_cache_lock:
+                local_response = self._local_cache.get(cache_key)
+            if local_response is not None:
+                logger.debug(f"Local cache hit for {endpoint_name} after waiting for an in-flight request")
+                return local_response
+            try:
+                return self._fetch_response(endpoint_name, endpoint_path, ttl, cache_key, **kwargs)
+            finally:
+                with self._local_cache_lock:
+                    self._request_locks.pop(cache_key, None)
+
+    def _fetch_response(self, endpoint_name: str, endpoint_path: str, ttl: int, cache_key: str, **kwargs) -> Dict:
+        """
+        Fetch a response from Redis, or from the API when it is not cached, and store it in the caches.
+
+        Args:
+            endpoint_name: Name of the endpoint to call
+            endpoint_path: URL path template of the endpoint
+            ttl: Time-to-live of the cached response in seconds
+            cache_key: The cache key of the request
+            **kwargs: Parameters to format into the endpoint URL
+
+        Returns:
+            Dict: API response data, either from Redis or a fresh API call
+
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+            requests.exceptions.HTTPError: If API returns non-200 status
+            orjson.JSONDecodeError: If response is not valid JSON
+        """
         cached_response = self.redis_service.get_cached_response(cache_key)
         if cached_response:
             logger.info(f"Cache hit for {endpoint_name}")
             try:
-                return json.loads(cached_response)
-            except json.JSONDecodeError as e:
+                data = orjson.loads(cached_response)
+                self._set_local_cache(cache_key, data)
+                return data
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to decode cached response for {endpoint_name}: {e}")
 
         # If not in cache or cache decode failed, make the API request
-        url = str(self.config.base_url + endpoint_path.format(**kwargs))
+        url = str(self.config.base_url + endpoint_path.format_map(kwargs))
         logger.info(f"Cache miss, performing API request to URL: {url}")
 
         response = self.session.get(url)
         response.raise_for_status()  # Raises HTTPError for bad responses
-        data = response.json()
+        raw_response = response.content
+        data = orjson.loads(raw_response)
 
-        try:
-            # Cache the response as JSON string
-            cached_data = json.dumps(data)
-            self.redis_service.set_cached_response(cache_key, cached_data, ttl)
-            logger.info(f"Cached response for {endpoint_name} with TTL {ttl}s")
-        except (TypeError, json.JSONEncodeError) as e:
-            logger.error(f"Failed to cache response for {endpoint_name}: {e}")
+        # Cache the response body as received, it is already a JSON document
+        self.redis_service.set_cached_response_async(cache_key, raw_response, ttl)
+        logger.info(f"Cached response for {endpoint_name} with TTL {ttl}s")
 
+        self._set_local_cache(cache_key, data)
         return data
 
+    def _set_local_cache(self, cache_key: str, data: Dict) -> None:
+        """
+        Store a decoded response in the in-process cache.
+
+        Args:
+            cache_key: The Redis cache key of the response
+            data: The decoded response data
+        """
+        with self._local_cache_lock:
+            self._local_cache[cache_key] = data
+
     def get_characters(self, ) -> Dict:
         """
         Get a list of all available characters.
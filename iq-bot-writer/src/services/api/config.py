@@ -9,3 +9,6 @@ load_dotenv()
 class ApiConfig:
     """Configuration for the API."""
     base_url: str = "https://potterapi-fedeperin.vercel.app/en"
+    # Keep-alive connections kept per host, enough for every writer thread calling the API at once
+    pool_connections: int = 4
+    pool_maxsize: int = 32
@@ -1,28 +1,34 @@
 """Constants for the API endpoints."""
 
-from typing import Final
+from typing import Final, NamedTuple
 
 from iq_bot_global.constants import CACHE_TTL
 
 # Default TTL if not specified
 DEFAULT_TTL_SECONDS: Final[int] = CACHE_TTL.HOUR
 
+# In-process cache kept in front of Redis for repeated requests within a run
+LOCAL_CACHE_SIZE: Final[int] = 1024
+LOCAL_CACHE_TTL_SECONDS: Final[int] = 300
+
+
+class EndpointSpec(NamedTuple):
+    """Configuration of a single API endpoint."""
+    path: str
+    ttl_seconds: int = DEFAULT_TTL_SECONDS
+
+
 # API Endpoints mapped to client methods
-ENDPOINTS: Final[dict[str, dict[str, str | int]]] = {
-    'get_characters': {
-        'path': '/characters',
-        'ttl_seconds': CACHE_TTL.WEEK
-    },
-    'get_spells': {
-        'path': '/spells',
-        'ttl_seconds': CACHE_TTL.WEEK
-    },
-    'get_houses': {
-        'path': '/houses',
-        'ttl_seconds': CACHE_TTL.WEEK
-    }
+ENDPOINTS: Final[dict[str, EndpointSpec]] = {
+    'get_characters': EndpointSpec('/characters', CACHE_TTL.WEEK),
+    'get_spells': EndpointSpec('/spells', CACHE_TTL.WEEK),
+    'get_houses': EndpointSpec('/houses', CACHE_TTL.WEEK),
 }
 
+# Flat per-endpoint lookups, built once so each accessor is a single dict lookup
+_TTL_BY_NAME: Final[dict[str, int]] = {name: endpoint.ttl_seconds for name, endpoint in ENDPOINTS.items()}
+_PATH_BY_NAME: Final[dict[str, str]] = {name: endpoint.path for name, endpoint in ENDPOINTS.items()}
+
 
 def get_endpoint_ttl(endpoint_name: str) -> int:
     """
@@ -36,7 +42,7 @@ def get_endpoint_ttl(endpoint_name: str) -> int:
             - Configured TTL if endpoint exists in ENDPOINTS
             - DEFAULT_TTL_SECONDS (1 hour) if endpoint not found.
     """
-    return ENDPOINTS.get(endpoint_name, {}).get('ttl_seconds', DEFAULT_TTL_SECONDS)
+    return _TTL_BY_NAME.get(endpoint_name, DEFAULT_TTL_SECONDS)
 
 
 def get_endpoint_path(endpoint_name: str) -> str:
@@ -52,6 +58,7 @@ def get_endpoint_path(endpoint_name: str) -> str:
     Raises:
         KeyError: If endpoint_name is not found in ENDPOINTS configuration
     """
-    if endpoint_name not in ENDPOINTS:
-        raise KeyError(f"Endpoint '{endpoint_name}' not found")
-    return ENDPOINTS[endpoint_name]['path']
+    try:
+        return _PATH_BY_NAME[endpoint_name]
+    except KeyError:
+        raise KeyError(f"Endpoint '{endpoint_name}' not found") from None
@@ -1,23 +1,59 @@
 import logging
 import os
+import threading
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 from openai import OpenAI
 
 from iq_bot_global.constants import OPENAI_DEFAULTS
 
 logger = logging.getLogger(__name__)
 
+# Appended to the system message of a batched request, describing its input and output format
+BATCH_INSTRUCTIONS = (
+    'The user message is a JSON object with a "prompts" array. Each prompt has an "id", a "question" and the '
+    '"information" to answer it with. Answer every question separately, using only the information of its own '
+    'prompt, and reply with a JSON object of the form {"responses": [{"id": "<prompt id>", "response": "<answer>"}]} '
+    'containing one entry per prompt.'
+)
+
+# Endpoint every Batch API request is made against
+BATCH_API_ENDPOINT = "/v1/chat/completions"
+# Batch API job states after which the job will not change any more
+BATCH_API_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+    Sharing one client reuses its pooled HTTP connections across every OpenAIService.
+
+    Returns:
+        OpenAI: The shared client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return _client
+
 
 class OpenAIService:
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.client = _get_client()
+        self.model = os.getenv("OPENAI_MODEL") or OPENAI_DEFAULTS.MODEL
 
     def generate_response(self, prompt_data: str, system: str) -> str:
         """Generate a response using OpenAI's API with style guide context."""
         try:
             logger.debug(f"Generating OpenAI response with system: {system} and prompt: {prompt_data}")
             response = self.client.chat.completions.create(
-                model=os.getenv("OPENAI_MODEL") or OPENAI_DEFAULTS.MODEL,
+                model=self.model,
                 messages=[
                     {"role": "system", "content": system},
                     {"role": "user", "content": prompt_data}
@@ -31,3 +67,129 @@ class OpenAIService:
             error_msg = f"Failed to generate OpenAI response: {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg)
+
+    def generate_batch(self, prompt_items: List[Tuple[str, str, str]], system: str) -> Dict[str, str]:
+        """
+        Generate responses for several prompts sharing a system message with a single OpenAI request.
+
+        Args:
+            prompt_items: (prompt id, question, prompt content) for each prompt
+            system: The system message shared by the prompts
+
+        Returns:
+            Dict[str, str]: The generated responses keyed by prompt ID. Prompts the model
+                did not answer are missing from the result.
+
+        Raises:
+            Exception: If the request fails or the reply is not valid JSON
+        """
+        try:
+            logger.debug(f"Generating OpenAI responses for a batch of {len(prompt_items)} prompts")
+            user_message = orjson.dumps({
+                "prompts": [
+                    {"id": prompt_id, "question": question, "information": content}
+                    for prompt_id, question, content in prompt_items
+                ]
+            }).decode('utf-8')
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": f"{system}\n\n{BATCH_INSTRUCTIONS}"},
+                    {"role": "user", "content": user_message}
+                ],
+                temperature=OPENAI_DEFAULTS.TEMPERATURE,
+                response_format={"type": "json_object"}
+            )
+            answers = orjson.loads(response.choices[0].message.content).get("responses", [])
+            return {
+                str(answer["id"]): answer["response"]
+                for answer in answers
+                if isinstance(answer, dict) and "id" in answer and isinstance(answer.get("response"), str)
+            }
+        except Exception as e:
+            error_msg = f"Failed to generate OpenAI batch response: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    def submit_batch_job(self, prompt_items: List[Tuple[str, str, str]]) -> str:
+        """
+        Submit an OpenAI Batch API job generating responses for many prompts.
+        The requests are uploaded as a JSONL file and the job is created without waiting for it,
+        as it can take up to its 24 hour completion window, at a lower cost than online requests.
+
+        Args:
+            prompt_items: (custom id, prompt content, system message) for each prompt
+
+        Returns:
+            str: The ID of the batch job, for get_batch_job_results
+
+        Raises:
+            Exception: If the job cannot be created
+        """
+        try:
+            logger.debug(f"Submitting an OpenAI batch job for {len(prompt_items)} prompts")
+            input_lines = b"\n".join(
+                orjson.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": BATCH_API_ENDPOINT,
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "system", "content": system},
+                            {"role": "user", "content": prompt_data}
+                        ],
+                        "temperature": OPENAI_DEFAULTS.TEMPERATURE
+                    }
+                })
+                for custom_id, prompt_data, system in prompt_items
+            )
+            input_file = self.client.files.create(file=("batch.jsonl", input_lines), purpose="batch")
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=BATCH_API_ENDPOINT,
+                completion_window="24h"
+            )
+            return batch.id
+        except Exception as e:
+            error_msg = f"Failed to submit OpenAI batch job: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    def get_batch_job_results(self, batch_id: str) -> Tuple[str, Optional[Dict[str, str]]]:
+        """
+        Check an OpenAI Batch API job once, downloading its responses if it has finished.
+        A job that failed, expired or was cancelled can still have an output file holding
+        the requests that finished before it stopped, so those are returned too.
+
+        Args:
+            batch_id: The ID returned by submit_batch_job
+
+        Returns:
+            Tuple[str, Optional[Dict[str, str]]]: The status of the job, and once it has reached a
+                final state, the generated responses keyed by custom ID. Requests that did not
+                finish successfully within the job are missing from the responses.
+
+        Raises:
+            Exception: If the job or its output cannot be fetched
+        """
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status not in BATCH_API_FINAL_STATES:
+                return batch.status, None
+
+            responses = {}
+            if batch.output_file_id:
+                for line in self.client.files.content(batch.output_file_id).content.splitlines():
+                    if not line.strip():
+                        continue
+                    result = orjson.loads(line)
+                    response = result.get("response") or {}
+                    if response.get("status_code") == 200:
+                        responses[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            logger.debug(f"OpenAI batch job {batch_id} answered {len(responses)} prompts")
+            return batch.status, responses
+        except Exception as e:
+            error_msg = f"Failed to fetch OpenAI batch job {batch_id}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
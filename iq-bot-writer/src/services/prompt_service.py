@@ -1,22 +1,141 @@
 """Service for generating and managing prompts."""
 import hashlib
-import json
 import logging
+import threading
 import uuid
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Any, List, Optional, Set
+
+import orjson
+from cachetools import TLRUCache
 
 from iq_bot_global.constants import REDIS_KEYS, CACHE_TTL
 from iq_bot_global.services.redis_service import RedisService
 from iq_bot_global.utils import (
+    compile_template,
+    count_param_combinations,
     extract_template_params,
-    generate_param_combinations,
-    validate_template_params,
-    format_template_with_nested_params
+    iter_param_combinations,
+    format_validated_template,
+    generated_prompt_key
 )
 from services.prompt_template_service import PromptTemplateService
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of prompts written to Redis in a single pipeline
+WRITE_BATCH_SIZE = 500
+
+# Version segment of generated prompt cache keys, bumped whenever the params hash changes
+PARAMS_HASH_VERSION = 'v2'
+
+# Maximum number of generated prompts kept in the in-process cache
+LOCAL_CACHE_SIZE = 1024
+
+
+def _template_fingerprint(template: Dict[str, Any]) -> str:
+    """
+    Fingerprint a prompt template, so prompts cached from an older version of it can be told apart.
+
+    Args:
+        template: The prompt template configuration
+
+    Returns:
+        str: A hash of the whole template configuration
+    """
+    return hashlib.blake2b(
+        orjson.dumps(template, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        digest_size=16
+    ).hexdigest()
+
+
+def _generated_prompt_ttu(_key: str, generated_prompt: Dict[str, Any], now: float) -> float:
+    """
+    Expire a locally cached generated prompt after its template's TTL, as in Redis.
+
+    Args:
+        _key: The cache key of the generated prompt
+        generated_prompt: The generated prompt with its template metadata
+        now: The current cache timer value
+
+    Returns:
+        float: The time at which the cached prompt expires
+    """
+    return now + generated_prompt.get('metadata', {}).get('ttl_seconds', CACHE_TTL.DEFAULT)
+
+
+@dataclass
+class GeneratedPrompt:
+    """
+    A prompt generated from a template for one parameter combination.
+
+    Uses __slots__ so large templates do not hold a full dict per combination;
+    the parameter values specific to the combination are kept in ``extras``.
+    """
+    __slots__ = ('id', 'prompt_template_id', 'title', 'topic', 'cache_key', 'context_keys', 'ttl_seconds',
+                 'enabled', 'template_fingerprint', 'extras')
+
+    id: str
+    prompt_template_id: str
+    title: str
+    topic: str
+    cache_key: str
+    context_keys: List[str]
+    ttl_seconds: int
+    enabled: bool
+    template_fingerprint: Optional[str]
+    extras: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GeneratedPrompt':
+        """
+        Build a generated prompt from its cached dict form. The given dict is consumed.
+
+        Args:
+            data: The decoded generated prompt
+
+        Returns:
+            GeneratedPrompt: The generated prompt
+
+        Raises:
+            KeyError: If a required field is missing
+        """
+        return cls(
+            id=data.pop('id'),
+            prompt_template_id=data.pop('prompt_template_id'),
+            title=data.pop('title'),
+            topic=data.pop('topic'),
+            cache_key=data.pop('cache_key'),
+            context_keys=data.pop('context_keys'),
+            ttl_seconds=data.pop('ttl_seconds'),
+            enabled=data.pop('enabled'),
+            # Prompts cached before fingerprints were recorded have none, so they never match their template
+            template_fingerprint=data.pop('template_fingerprint', None),
+            extras=data
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the dict form of the generated prompt, as cached in Redis and read by the writer.
+
+        Returns:
+            Dict[str, Any]: The generated prompt with its parameter values as top-level fields
+        """
+        prompt_data = {
+            'id': self.id,
+            'prompt_template_id': self.prompt_template_id,
+            'title': self.title,
+            'topic': self.topic,
+            'cache_key': self.cache_key,
+            'context_keys': self.context_keys,
+            'ttl_seconds': self.ttl_seconds,
+            'enabled': self.enabled,
+            'template_fingerprint': self.template_fingerprint
+        }
+        prompt_data.update(self.extras)
+        return prompt_data
+
 
 class PromptService:
     """Service for generating and managing prompts from templates."""
@@ -25,6 +144,11 @@ class PromptService:
         """Initialize the prompt service with required dependencies."""
         self.redis_service = RedisService()
         self.template_service = PromptTemplateService()
+        # Generated prompts already fetched or built in this process, checked before Redis
+        self._local_cache = TLRUCache(maxsize=LOCAL_CACHE_SIZE, ttu=_generated_prompt_ttu)
+        self._local_cache_lock = threading.Lock()
+        # IDs of the generated prompts indexed in Redis, loaded on first use; an ID missing from it is a definite miss
+        self._known_prompt_ids: Optional[Set[str]] = None
 
     def initialize_prompts(self, data_sources: Dict[str, List[Any]]):
         """Initialize all prompts from templates and cache them.
@@ -36,6 +160,7 @@ class PromptService:
         This should be called during application startup, not during service initialization.
         """
         logger.info("Initializing prompts from templates...")
+        self._prune_indexes()
         templates = self.template_service.load_templates()
         prompt_count = 0
 
@@ -58,23 +183,30 @@ class PromptService:
 
                 try:
                     generated = self.generate_prompts_from_template(template_id, data_sources)
-                    for prompt in generated:
-                        prompt_id = prompt['id']
-                        # Cache each prompt
-                        self.redis_service.set_cached_response(
-                            f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:{template_id}:{prompt_id}",
-                            json.dumps(prompt),
-                            prompt.get('ttl_seconds', CACHE_TTL.DEFAULT)
-                        )
+                    known_prompt_ids = self._get_known_prompt_ids()
+                    # The TTL is a template attribute, shared by every prompt generated from it
+                    ttl_seconds = template.get('ttl_seconds', CACHE_TTL.DEFAULT)
+                    pipe = self.redis_service.pipeline()
+                    for batch_count, prompt in enumerate(generated, 1):
+                        prompt_id = prompt.id
+                        prompt_key = generated_prompt_key(template_id, prompt_id)
+                        # Cache each prompt and index it by ID and topic so readers can find it without a scan
+                        pipe.setex(prompt_key, ttl_seconds, orjson.dumps(prompt.to_dict()))
+                        pipe.hset(REDIS_KEYS.PROMPT_INDEX, prompt_id, prompt_key)
+                        pipe.sadd(f"{REDIS_KEYS.TOPIC_INDEX_PREFIX}:{prompt.topic}", prompt_key)
+                        if batch_count % WRITE_BATCH_SIZE == 0:
+                            pipe.execute()
                         prompt_count += 1
+                        known_prompt_ids.add(prompt_id)
+                    pipe.execute()
                 except Exception as e:
                     logger.error(f"Error generating prompts for template {template_id}: {e}")
                     continue
 
         logger.info(f"Initialized {prompt_count} prompts from all templates")
 
-    def generate_prompts_from_template(self, template_id: str, data_sources: Dict[str, List[Any]]) -> List[
-        Dict[str, Any]]:
+    def generate_prompts_from_template(self, template_id: str,
+                                       data_sources: Dict[str, List[Any]]) -> List[GeneratedPrompt]:
         """
         Generate prompts from a template with all possible combinations of parameters.
 
@@ -84,7 +216,7 @@ class PromptService:
                         of possible values for that parameter
 
         Returns:
-            List[Dict[str, Any]]: List of generated prompts with all combinations
+            List[GeneratedPrompt]: List of generated prompts with all combinations
         """
         template = self.template_service.get_template_by_id(template_id)
         if not template:
@@ -97,9 +229,7 @@ class PromptService:
 
         # Filter data sources to only include required parameters
         template_data_sources = {}
-        for param in required_params:
-            if param == 'id':  # Skip special parameters
-                continue
+        for param in required_params - {'id'}:  # Skip special parameters
             # Convert parameter names to match data source keys (e.g., 'team' -> 'teams')
             param_key = param if param in data_sources else f"{param}s"
             if param_key in data_sources:
@@ -107,104 +237,185 @@ class PromptService:
             else:
                 logger.warning(f"No data source available for parameter: {param}")
 
-        # Generate parameter combinations
-        param_combinations = generate_param_combinations(template_data_sources)
-        logger.info(f"Generating {len(param_combinations)} combinations for template {template_id}")
+        # Generate parameter combinations lazily, one at a time.
+        # A template without parameters has exactly one, so skip the product setup.
+        if template_data_sources:
+            param_combinations = iter_param_combinations(template_data_sources)
+        else:
+            param_combinations = iter(({},))
+        logger.info(f"Generating {count_param_combinations(template_data_sources)} combinations "
+                    f"for template {template_id}")
+
+        # Values derived from the template once, rather than per combination
+        template_namespace = uuid.UUID(template_id)
+        format_title = compile_template(template['title'])
+        template_topic = template['topic']
+        template_context_keys = template['context_keys']
+        template_ttl_seconds = template.get('ttl_seconds', 3600)
+        template_enabled = template.get('enabled', True)
+        template_fingerprint = _template_fingerprint(template)
+
+        # Remove trailing 's' if present to match template parameter names
+        template_param_names = {
+            param_name: param_name[:-1] if param_name.endswith('s') else param_name
+            for param_name in template_data_sources
+        }
+
+        # The uuid5 name joins the ID parts in sorted order; with a single parameter there is nothing to sort
+        sort_id_parts = len(template_data_sources) > 1
 
+        known_prompt_ids = self._get_known_prompt_ids()
         generated_prompts = []
-        for params in param_combinations:
-            try:
-                # Create ID from available parameters dynamically
-                id_parts = []
-                for param_name, param_value in params.items():
-                    if isinstance(param_value, dict) and 'id' in param_value:
-                        id_parts.append(str(param_value['id']))
-                    else:
-                        id_parts.append(str(param_value))
-
-                generated_prompt_id = str(uuid.uuid5(
-                    uuid.UUID(template_id),
-                    ':'.join(sorted(id_parts)) if id_parts else 'default'
-                ))
-
-                # Check cache
-                cached_prompt = self.redis_service.get_cached_response(
-                    f"{REDIS_KEYS.PROMPT_PREFIX}:{generated_prompt_id}")
-                if cached_prompt:
+        # Check the cache for a chunk of combinations at a time, with one MGET per chunk
+        for chunk in iter(lambda: list(islice(param_combinations, WRITE_BATCH_SIZE)), []):
+            prompt_ids = [self._generated_prompt_id(template_namespace, params, sort_id_parts) for params in chunk]
+            cached_prompts = [None] * len(chunk)
+            # Only look up prompts known to be indexed, the rest cannot be in Redis
+            known_positions = [i for i, prompt_id in enumerate(prompt_ids) if prompt_id in known_prompt_ids]
+            if known_positions:
+                known_values = self.redis_service.get_cached_responses(
+                    [generated_prompt_key(template_id, prompt_ids[i]) for i in known_positions])
+                for i, value in zip(known_positions, known_values):
+                    cached_prompts[i] = value
+
+            for params, generated_prompt_id, cached_prompt in zip(chunk, prompt_ids, cached_prompts):
+                try:
+                    # Use the cached prompt if it is still in Redis and was generated from the current template
+                    if cached_prompt:
+                        try:
+                            prompt = GeneratedPrompt.from_dict(orjson.loads(cached_prompt))
+                        except (orjson.JSONDecodeError, KeyError):
+                            logger.warning(f"Invalid cached prompt for {generated_prompt_id}, regenerating")
+                        else:
+                            if prompt.template_fingerprint == template_fingerprint:
+                                generated_prompts.append(prompt)
+                                continue
+                            logger.debug(f"Template {template_id} changed since prompt {generated_prompt_id} "
+                                         f"was cached, regenerating")
+                            if prompt.topic != template_topic:
+                                # The prompt is added to its new topic's set when it is cached again
+                                self.redis_service.srem_cached(
+                                    f"{REDIS_KEYS.TOPIC_INDEX_PREFIX}:{prompt.topic}",
+                                    generated_prompt_key(template_id, generated_prompt_id))
+
+                    # Build format params for title dynamically
+                    format_params = {}
+                    for param_name, param_value in params.items():
+                        template_param_name = template_param_names[param_name]
+                        if isinstance(param_value, dict):
+                            # For dictionary parameters, add both the raw dict and common fields
+                            format_params[template_param_name] = param_value[template_param_name]
+                            for key, value in param_value.items():
+                                if format_params[template_param_name] != value:
+                                    format_params[f"{template_param_name}_{key}"] = value
+                        else:
+                            format_params[template_param_name] = param_value
+
+                    # Generate title using available parameters
                     try:
-                        prompt_data = json.loads(cached_prompt)
-                        generated_prompts.append(prompt_data)
+                        generated_title = format_title(format_params)
+                    except KeyError as e:
+                        logger.warning(f"Missing required parameter for title: {e}")
                         continue
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid cached prompt for {generated_prompt_id}, regenerating")
-
-                # Build format params for title dynamically
-                format_params = {}
-                for param_name, param_value in params.items():
-                    # Remove trailing 's' if present to match template parameter names
-                    template_param_name = param_name[:-1] if param_name.endswith('s') else param_name
-                    if isinstance(param_value, dict):
-                        # For dictionary parameters, add both the raw dict and common fields
-                        format_params[template_param_name] = param_value[template_param_name]
-                        for key, value in param_value.items():
-                            if format_params[template_param_name] != value:
-                                format_params[f"{template_param_name}_{key}"] = value
-                    else:
-                        format_params[template_param_name] = param_value
-
-                # Generate title using available parameters
-                try:
-                    generated_title = template['title'].format(**format_params)
-                except KeyError as e:
-                    logger.warning(f"Missing required parameter for title: {e}")
-                    continue
 
-                # Format cache key with available parameters
-                cache_key_params = {'id': generated_prompt_id}
-                for param_name, param_value in params.items():
-                    # Remove trailing 's' if present to match template parameter names
-                    template_param_name = param_name[:-1] if param_name.endswith('s') else param_name
-                    if isinstance(param_value, dict) and 'id' in param_value:
-                        cache_key_params[template_param_name] = param_value['id']
-                    else:
-                        cache_key_params[template_param_name] = param_value
-
-                cache_key_template = template.get('cache_key', '')
-                if cache_key_template and validate_template_params(cache_key_template, cache_key_params):
-                    response_cache_key = format_template_with_nested_params(cache_key_template, cache_key_params)
-                else:
-                    logger.warning("Invalid or missing cache key template parameters")
-                    response_cache_key = ''
-
-                # Build prompt data with all available parameters
-                prompt_data = {
-                    'id': generated_prompt_id,
-                    'prompt_template_id': template_id,
-                    'title': generated_title,
-                    'topic': template['topic'],
-                    'cache_key': response_cache_key,
-                    'context_keys': template['context_keys'],
-                    'ttl_seconds': template.get('ttl_seconds', 3600),
-                    'enabled': template.get('enabled', True)
-                }
-
-                # Add all parameters to prompt data
-                for param_name, param_value in params.items():
-                    if isinstance(param_value, dict):
-                        # For dictionary parameters (like team), add both ID and full object
-                        for key, value in param_value.items():
-                            prompt_data[f"{param_name}_{key}"] = value
-                    else:
-                        prompt_data[param_name] = param_value
-
-                generated_prompts.append(prompt_data)
-
-            except Exception as e:
-                logger.error(f"Error generating prompt for parameters {params}: {e}")
-                continue
+                    # Format cache key with available parameters
+                    cache_key_params = {'id': generated_prompt_id}
+                    for param_name, param_value in params.items():
+                        template_param_name = template_param_names[param_name]
+                        if isinstance(param_value, dict) and 'id' in param_value:
+                            cache_key_params[template_param_name] = param_value['id']
+                        else:
+                            cache_key_params[template_param_name] = param_value
+
+                    response_cache_key = None
+                    if cache_key_template:
+                        response_cache_key = format_validated_template(cache_key_template, cache_key_params)
+                    if response_cache_key is None:
+                        logger.warning("Invalid or missing cache key template parameters")
+                        response_cache_key = ''
+
+                    # Add all parameters to prompt data
+                    extras = {}
+                    for param_name, param_value in params.items():
+                        if isinstance(param_value, dict):
+                            # For dictionary parameters (like team), add both ID and full object
+                            for key, value in param_value.items():
+                                extras[f"{param_name}_{key}"] = value
+                        else:
+                            extras[param_name] = param_value
+
+                    generated_prompts.append(GeneratedPrompt(
+                        id=generated_prompt_id,
+                        prompt_template_id=template_id,
+                        title=generated_title,
+                        topic=template_topic,
+                        cache_key=response_cache_key,
+                        context_keys=template_context_keys,
+                        ttl_seconds=template_ttl_seconds,
+                        enabled=template_enabled,
+                        template_fingerprint=template_fingerprint,
+                        extras=extras
+                    ))
+
+                except Exception as e:
+                    logger.error(f"Error generating prompt for parameters {params}: {e}")
+                    continue
 
         return generated_prompts
 
+    def _prune_indexes(self) -> None:
+        """
+        Remove the index entries of generated prompts and responses whose keys have expired.
+        The indexes have no TTL of their own, so without this they would grow with every run.
+        Runs before the known prompt IDs are loaded from the prompt index, so they only hold live prompts.
+        """
+        removed = self.redis_service.prune_hash_index(REDIS_KEYS.PROMPT_INDEX)
+        removed += self.redis_service.prune_hash_index(REDIS_KEYS.RESPONSE_INDEX)
+        for topic_key in self.redis_service.get_keys(f"{REDIS_KEYS.TOPIC_INDEX_PREFIX}:*"):
+            removed += self.redis_service.prune_set_index(topic_key)
+        logger.info(f"Removed {removed} expired entries from the prompt indexes")
+
+    def _get_known_prompt_ids(self) -> Set[str]:
+        """
+        Get the IDs of the generated prompts indexed in Redis, loading them from the prompt index on first use.
+
+        Returns:
+            Set[str]: The known generated prompt IDs
+        """
+        if self._known_prompt_ids is None:
+            self._known_prompt_ids = {
+                prompt_id.decode('utf-8') for prompt_id in self.redis_service.hkeys_cached(REDIS_KEYS.PROMPT_INDEX)
+            }
+            logger.debug(f"Loaded {len(self._known_prompt_ids)} known prompt IDs from the prompt index")
+        return self._known_prompt_ids
+
+    @staticmethod
+    def _generated_prompt_id(template_namespace: uuid.UUID, params: Dict[str, Any], sort_id_parts: bool) -> str:
+        """
+        Derive the deterministic ID of the prompt generated for a parameter combination.
+
+        Args:
+            template_namespace: UUID of the template, used as the uuid5 namespace
+            params: The parameter combination
+            sort_id_parts: Whether the ID parts need sorting, i.e. there is more than one parameter
+
+        Returns:
+            str: The generated prompt ID
+        """
+        # Create ID from available parameters dynamically
+        id_parts = [
+            str(param_value['id']) if isinstance(param_value, dict) and 'id' in param_value
+            else str(param_value)
+            for param_value in params.values()
+        ]
+        if sort_id_parts:
+            id_parts.sort()
+
+        return str(uuid.uuid5(
+            template_namespace,
+            ':'.join(id_parts) if id_parts else 'default'
+        ))
+
     def get_generated_prompt(self, template_key: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Generate a prompt from a template with the given parameters and cache the result.
@@ -220,15 +431,26 @@ class PromptService:
             KeyError: If template_key not found or required parameter missing
         """
         # Generate cache key for this specific generated prompt
-        params_hash = hashlib.md5(json.dumps(params or {}, sort_keys=True).encode()).hexdigest()
-        cache_key = f"{REDIS_KEYS.PROMPT_PREFIX}:{template_key}:{params_hash}"
+        params_hash = hashlib.blake2b(
+            orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+            digest_size=16
+        ).hexdigest()
+        cache_key = f"{REDIS_KEYS.PROMPT_PREFIX}:{PARAMS_HASH_VERSION}:{template_key}:{params_hash}"
+
+        # Try the in-process cache first, then Redis
+        with self._local_cache_lock:
+            local_prompt = self._local_cache.get(cache_key)
+        if local_prompt is not None:
+            return local_prompt
 
-        # Try to get from cache first
         cached_prompt = self.redis_service.get_cached_response(cache_key)
         if cached_prompt:
             try:
-                return json.loads(cached_prompt)
-            except json.JSONDecodeError:
+                generated_prompt = orjson.loads(cached_prompt)
+                with self._local_cache_lock:
+                    self._local_cache[cache_key] = generated_prompt
+                return generated_prompt
+            except orjson.JSONDecodeError:
                 logger.warning(f"Failed to decode cached prompt for {template_key}, regenerating")
 
         # If not in cache, generate prompt from template
@@ -242,7 +464,7 @@ class PromptService:
         # Fill template parameters if provided
         if params:
             try:
-                prompt_text = prompt_text.format(**params)
+                prompt_text = prompt_text.format_map(params)
             except KeyError as e:
                 raise KeyError(f"Missing required parameter: {e}")
 
@@ -255,8 +477,10 @@ class PromptService:
         # Cache the generated prompt
         self.redis_service.set_cached_response(
             cache_key,
-            json.dumps(generated_prompt),
+            orjson.dumps(generated_prompt),
             template_config.get("ttl_seconds", CACHE_TTL.DEFAULT)
         )
+        with self._local_cache_lock:
+            self._local_cache[cache_key] = generated_prompt
 
         return generated_prompt
@@ -2,9 +2,7 @@
 import logging
 from typing import Dict, Any, Optional
 
-import yaml
-
-from iq_bot_global.prompts import TEMPLATES_PATH
+from iq_bot_global.prompts import load_prompts, get_prompt_by_id, clear_prompts_cache
 
 logger = logging.getLogger(__name__)
 
@@ -12,24 +10,16 @@ logger = logging.getLogger(__name__)
 class PromptTemplateService:
     """Service for managing prompt templates."""
 
-    def __init__(self):
-        """Initialize the template service with caching."""
-        self._templates_cache = None
-
     def load_templates(self) -> Dict[str, Any]:
         """
         Load prompt templates from YAML file with caching.
+        The parsed templates are shared process-wide, so the file is only parsed once.
         
         Returns:
             Dict[str, Any]: Dictionary containing prompt templates and their configurations.
         """
-        if self._templates_cache is not None:
-            return self._templates_cache
-
         try:
-            with open(TEMPLATES_PATH, 'r') as file:
-                self._templates_cache = yaml.safe_load(file)['prompts']
-                return self._templates_cache
+            return load_prompts()
         except Exception as e:
             logger.error(f"Error loading prompt templates: {e}")
             return {}
@@ -44,13 +34,11 @@ class PromptTemplateService:
         Returns:
             Optional[Dict[str, Any]]: Prompt template configuration dictionary if found.
         """
-        templates = self.load_templates()
-        for topic_templates in templates.values():
-            if isinstance(topic_templates, list):
-                for template in topic_templates:
-                    if isinstance(template, dict) and template.get('id') == template_id:
-                        return template
-        return None
+        try:
+            return get_prompt_by_id(template_id)
+        except Exception as e:
+            logger.error(f"Error loading prompt templates: {e}")
+            return None
 
     def get_template(self, template_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -67,4 +55,4 @@ class PromptTemplateService:
 
     def clear_cache(self) -> None:
         """Clear the template cache to force reloading from file."""
-        self._templates_cache = None
+        clear_prompts_cache()
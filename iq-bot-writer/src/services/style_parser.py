@@ -1,28 +1,66 @@
 import logging
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from iq_bot_global.constants import FilePaths
+from iq_bot_global.constants import FILE_PATHS
 
 logger = logging.getLogger(__name__)
 import yaml
 
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader
+
+# Seconds a cached style guide is reused before the file's modification time is checked again
+STYLE_GUIDE_RECHECK_SECONDS = 60
+
 
 class StyleParser:
     def __init__(self):
         self.style_guide_path = Path(
-            __file__).parent.parent.parent / FilePaths.RESOURCES_DIR / FilePaths.STYLE_GUIDE_DIR / FilePaths.STYLE_GUIDE_FILE
+            __file__).parent.parent.parent / FILE_PATHS.RESOURCES_DIR / FILE_PATHS.STYLE_GUIDE_DIR / FILE_PATHS.STYLE_GUIDE_FILE
+        # Style guide text, reused until the file's modification time changes
+        self._cached_style_guide: Optional[str] = None
+        self._cached_mtime: Optional[float] = None
+        self._cached_at: float = 0.0
 
     def load_style_guide(self) -> Dict[str, Any]:
         """Load and parse the style guide YAML file."""
         try:
-            with open(self.style_guide_path, 'r') as file:
-                return yaml.safe_load(file)
+            with open(self.style_guide_path, 'rb') as file:
+                return yaml.load(file, Loader=CSafeLoader)
         except Exception as e:
             logger.error(f"Failed to load style guide: {str(e)}")
             return {}
 
     def get_style_guide(self) -> str:
-        """Get formatted style guide as a string."""
-        style_guide = self.load_style_guide()
-        return yaml.dump(style_guide, default_flow_style=False)
+        """
+        Get the style guide as a string.
+        The YAML file text is embedded as-is, without a parse and dump round-trip.
+        The result is cached and only re-read when the style guide file is modified,
+        which is checked at most once every STYLE_GUIDE_RECHECK_SECONDS.
+        """
+        now = time.monotonic()
+        if self._cached_style_guide is not None and now - self._cached_at < STYLE_GUIDE_RECHECK_SECONDS:
+            return self._cached_style_guide
+
+        try:
+            mtime = self.style_guide_path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime is not None and self._cached_style_guide is not None and mtime == self._cached_mtime:
+            self._cached_at = now
+            return self._cached_style_guide
+
+        try:
+            style_guide = self.style_guide_path.read_text(encoding='utf-8')
+        except OSError as e:
+            logger.error(f"Failed to load style guide: {str(e)}")
+            return ''
+
+        if mtime is not None:
+            self._cached_style_guide, self._cached_mtime, self._cached_at = style_guide, mtime, now
+        return style_guide
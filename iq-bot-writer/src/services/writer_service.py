@@ -1,26 +1,205 @@
 """Writer service for generating and managing prompt-contents responses."""
+import _string
+import functools
 import inspect
-import json
 import logging
+import os
+import string
+import threading
+from collections import ChainMap
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
 from iq_bot_global import (
     RedisService,
-    extract_context_params
+    extract_context_params,
+    generated_prompt_key,
+    generated_prompt_pattern
 )
 from iq_bot_global.constants import (
     FILE_PATHS,
     REDIS_KEYS,
-    CACHE_TTL
+    CACHE_TTL,
+    WRITER_CONFIG
 )
+from iq_bot_global.utils import compile_template
 from services.api.client import ApiClient
 from services.openai_service import OpenAIService
 from services.style_parser import StyleParser
 from services.prompt_template_service import PromptTemplateService
 
+RESOURCES_PATH = Path(__file__).parent.parent.parent / FILE_PATHS.RESOURCES_DIR
+
+# Stands in for the question in the system message of a batched OpenAI request
+BATCH_QUESTION = "the question given with each prompt below"
+
+# Prompt keys recently found missing in Redis, remembered briefly so retries skip the lookup
+MISSING_PROMPT_CACHE_SIZE = 1024
+MISSING_PROMPT_CACHE_TTL_SECONDS = 2
+
+# Prompts recently answered from Redis, with their cached response, served locally without a round-trip
+HOT_PROMPT_CACHE_SIZE = 1024
+HOT_PROMPT_CACHE_TTL_SECONDS = 30
+
+
+@functools.lru_cache(maxsize=None)
+def _load_resource_template(directory: str, file_name: str) -> str:
+    """
+    Read a template file from the resources directory once per process.
+    Templates do not change at runtime, so every prompt reuses the same text.
+
+    Args:
+        directory: The resources subdirectory holding the template
+        file_name: The template file name
+
+    Returns:
+        str: The template text
+
+    Raises:
+        FileNotFoundError: If the template file doesn't exist
+    """
+    with open(RESOURCES_PATH / directory / file_name, 'r') as file:
+        return file.read()
+
+
+def _preload_resource_templates() -> None:
+    """
+    Read the system template and every prompt-content template into the template cache,
+    so the first prompt of each topic does not touch the disk.
+    """
+    _load_resource_template(FILE_PATHS.SYSTEM_DIR, FILE_PATHS.SYSTEM_FILE)
+    for template_path in (RESOURCES_PATH / FILE_PATHS.PROMPT_CONTENTS_DIR).glob('*.txt'):
+        _load_resource_template(FILE_PATHS.PROMPT_CONTENTS_DIR, template_path.name)
+
+
+def _format_prompt_field(text: str, params: Mapping[str, Any]) -> str:
+    """
+    Format a prompt field such as the title or cache key with the given parameters.
+    PromptService formats these fields when generating the prompt, so they normally
+    hold no placeholders left to fill and are returned without being parsed again.
+    The mapping is read directly with format_map, so a ChainMap of API data is never copied into kwargs.
+
+    Args:
+        text: The prompt field, possibly containing {param_name} placeholders
+        params: The parameters to fill in
+
+    Returns:
+        str: The formatted field
+
+    Raises:
+        KeyError: If a placeholder has no matching parameter
+    """
+    if '{' not in text and '}' not in text:
+        return text
+    return text.format_map(params)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_field_roots(template_str: str) -> FrozenSet[str]:
+    """
+    Get the names a str.format template looks up in its mapping, once per template.
+    Fields with attribute or index access, a conversion or a format spec, such as {fa.name},
+    {fb[0]} or {fc:>4}, are reduced to the name they are looked up by. Fields nested in a
+    format spec are included.
+
+    Args:
+        template_str: The template string
+
+    Returns:
+        FrozenSet[str]: The names of the mapping keys the template reads
+    """
+    roots = set()
+    for _, field_name, format_spec, _ in string.Formatter().parse(template_str):
+        if field_name is None:
+            continue
+        root = _string.formatter_field_name_split(field_name)[0]
+        if isinstance(root, str):
+            roots.add(root)
+        if format_spec:
+            roots |= _template_field_roots(format_spec)
+    return frozenset(roots)
+
+
+@functools.lru_cache(maxsize=None)
+def _method_param_lookups(method: Callable) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve the parameters of an API client method once per method, as the
+    context keys each parameter can be filled from.
+    A parameter ending in '_id' can also be filled from its name without the suffix,
+    which is used when the exact parameter name is not in the prompt contexts.
+
+    Args:
+        method: The API client method
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: (parameter name, context key) pairs. The fallback key of a
+            parameter comes before its exact name, so the exact name wins when both are present.
+    """
+    lookups = []
+    for param_name in inspect.signature(method).parameters:
+        if param_name.endswith('_id'):
+            lookups.append((param_name, param_name[:-3]))
+        lookups.append((param_name, param_name))
+    return tuple(lookups)
+
+
+class _BatchItemFuture:
+    """The result of one prompt within a batched response future."""
+
+    def __init__(self, batch_future: Future, position: int):
+        """
+        Args:
+            batch_future: The future returned for the whole batch by _run_batch
+            position: The position of the prompt within the batch
+        """
+        self._batch_future = batch_future
+        self._position = position
+
+    def result(self) -> dict:
+        """
+        Wait for the batch and return this prompt's response data.
+
+        Returns:
+            dict: The response data of the prompt
+
+        Raises:
+            Exception: If generating the prompt's response failed
+        """
+        result = self._batch_future.result()[self._position]
+        if isinstance(result, Exception):
+            raise result
+        # Copied, as callers waiting on the same cache key share the response data
+        return dict(result)
+
+
+class _SharedGenerationFuture:
+    """The result of a response another caller is already generating for the same cache key."""
+
+    def __init__(self, generation: Future):
+        """
+        Args:
+            generation: The future registered for the cache key in WriterService._generations
+        """
+        self._generation = generation
+
+    def result(self) -> dict:
+        """
+        Wait for the generation and return a copy of its response data.
+
+        Returns:
+            dict: The response data, copied as the metadata of each prompt is added to its own response
+
+        Raises:
+            Exception: If generating the response failed
+        """
+        return dict(self._generation.result())
+
 
 class WriterService:
     """Service for handling prompt-contents generation and response caching."""
@@ -29,29 +208,76 @@ class WriterService:
         """
         Initialize required services for prompt generation and response handling.
 
-        Sets up connections to:
-        - Redis for caching
+        Sets up the connection to Redis for caching and reads the prompt templates.
+        The remaining services are created on first use, so runs served from cached
+        responses never construct them:
         - OpenAI for response generation
         - Style parser for formatting guidelines
         - API client for API data
         - Template service for prompt management
 
         Raises:
-            Exception: If any required service fails to initialize
+            Exception: If the Redis service fails to initialize
         """
         self.redis_service = RedisService()
-        self.openai_service = OpenAIService()
-        self.style_parser = StyleParser()
-        self.api_client = ApiClient()
-        self.template_service = PromptTemplateService()
-
-    def _build_prompt_data(self, prompt_topic: str, context_data: dict) -> str:
+        _preload_resource_templates()
+        # Pool generating the uncached responses of a template concurrently, as each waits on the network
+        self._prompt_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('WRITER_MAX_WORKERS', WRITER_CONFIG.DEFAULT_MAX_WORKERS)),
+            thread_name_prefix='writer-prompt'
+        )
+        # Shared pool for the context API calls of a prompt, which are independent of each other
+        self._api_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('WRITER_API_WORKERS', WRITER_CONFIG.DEFAULT_API_WORKERS)),
+            thread_name_prefix='writer-api'
+        )
+        self._openai_batch_size = int(
+            os.getenv('WRITER_OPENAI_BATCH_SIZE', WRITER_CONFIG.DEFAULT_OPENAI_BATCH_SIZE))
+        # Uncached prompts of a template at which they are generated by one OpenAI Batch API job instead
+        self._batch_api_threshold = int(
+            os.getenv('WRITER_BATCH_API_THRESHOLD', WRITER_CONFIG.DEFAULT_BATCH_API_THRESHOLD))
+        self._missing_prompts = TTLCache(maxsize=MISSING_PROMPT_CACHE_SIZE, ttl=MISSING_PROMPT_CACHE_TTL_SECONDS)
+        self._missing_prompts_lock = threading.Lock()
+        self._hot_prompts = TTLCache(maxsize=HOT_PROMPT_CACHE_SIZE, ttl=HOT_PROMPT_CACHE_TTL_SECONDS)
+        self._hot_prompts_lock = threading.Lock()
+        # Futures of the responses being generated, by cache key
+        self._generations: Dict[str, Future] = {}
+        self._generations_lock = threading.Lock()
+        # Batch API job IDs of the cache keys a submitted job is still generating
+        self._pending_batch_jobs: Dict[str, str] = {}
+
+    @functools.cached_property
+    def openai_service(self) -> OpenAIService:
+        """The OpenAI service, created on first use."""
+        return OpenAIService()
+
+    @functools.cached_property
+    def style_parser(self) -> StyleParser:
+        """The style guide parser, created on first use."""
+        return StyleParser()
+
+    @functools.cached_property
+    def api_client(self) -> ApiClient:
+        """The API client, created on first use."""
+        return ApiClient()
+
+    @functools.cached_property
+    def template_service(self) -> PromptTemplateService:
+        """The prompt template service, created on first use."""
+        return PromptTemplateService()
+
+    def shutdown(self) -> None:
+        """Wait for the queued generations and API calls to finish and release the worker pools."""
+        self._prompt_executor.shutdown()
+        self._api_executor.shutdown()
+
+    def _build_prompt_data(self, prompt_topic: str, context_data: Mapping[str, Any]) -> str:
         """
         Build prompt content using context data and topic-specific template.
 
         Args:
             prompt_topic: The topic identifier for the prompt (e.g., 'character_prompts')
-            context_data: Dictionary of context data to format into the template
+            context_data: Mapping of context data to format into the template
 
         Returns:
             str: Formatted prompt content
@@ -61,20 +287,19 @@ class WriterService:
             ValueError: If required template variables are missing
             KeyError: If required context keys are missing
         """
-        with open(
-                Path(
-                    __file__).parent.parent.parent / FILE_PATHS.RESOURCES_DIR / FILE_PATHS.PROMPT_CONTENTS_DIR / f"{prompt_topic}.txt",
-                'r') as file:
-            content_template = file.read()
+        # The template text is cached, so it is only parsed into a formatter and its fields once
+        content_template = _load_resource_template(FILE_PATHS.PROMPT_CONTENTS_DIR, f"{prompt_topic}.txt")
+        format_content = compile_template(content_template)
 
-        # Create formatting dictionary where each key is prefixed with 'f'
+        # Create formatting dictionary where each key is prefixed with 'f', holding only the template's fields
         format_dict = {
-            f"f{key}": value
-            for key, value in context_data.items()
+            field: context_data[field[1:]]
+            for field in _template_field_roots(content_template)
+            if field.startswith('f') and field[1:] in context_data
         }
 
         try:
-            return content_template.format(**format_dict)
+            return format_content(format_dict)
         except KeyError as e:
             raise ValueError(f"Missing required key in template: {e}")
 
@@ -93,15 +318,11 @@ class WriterService:
             FileNotFoundError: If system template file doesn't exist
             KeyError: If template variables are missing
         """
-        with open(
-                Path(
-                    __file__).parent.parent.parent / FILE_PATHS.RESOURCES_DIR / FILE_PATHS.SYSTEM_DIR / FILE_PATHS.SYSTEM_FILE,
-                'r') as file:
-            system_template = file.read()
-        return system_template.format(
-            fprompt=str(question),
-            fstyle_guide=str(style_guide)
-        )
+        format_system = compile_template(_load_resource_template(FILE_PATHS.SYSTEM_DIR, FILE_PATHS.SYSTEM_FILE))
+        return format_system({
+            'fprompt': str(question),
+            'fstyle_guide': str(style_guide)
+        })
 
     def _get_context_data(self, context_key: str, params: dict) -> Any:
         """
@@ -122,27 +343,20 @@ class WriterService:
         try:
             method = getattr(self.api_client, context_key)
 
-            # Get the method's required parameters
-            method_params = inspect.signature(method).parameters
-
-            # Build parameters dictionary based on method's requirements
-            call_params = {}
-            for param_name in method_params:
-                # Try exact match first
-                if param_name in params:
-                    call_params[param_name] = params[param_name]
-                # If not found and param ends with '_id', try without '_id'
-                elif param_name.endswith('_id'):
-                    base_name = param_name[:-3]  # Remove '_id'
-                    if base_name in params:
-                        call_params[param_name] = params[base_name]
+            # Build parameters dictionary based on method's requirements, preferring an exact
+            # match and falling back to the name without '_id'
+            call_params = {
+                param_name: params[context_key]
+                for param_name, context_key in _method_param_lookups(method)
+                if context_key in params
+            }
 
             # Get the raw response from the API
             raw_response = method(**call_params)
 
-            # Log the response type and the context key being used
-            logger.debug(f"Raw response type for {context_key}: {type(raw_response)}")
-            logger.debug(f"About to transform data with context key: {context_key}")
+            # Log the response type and the context key being used, formatted only when debug logging is on
+            logger.debug("Raw response type for %s: %s", context_key, type(raw_response))
+            logger.debug("About to transform data with context key: %s", context_key)
             return raw_response
 
         except AttributeError:
@@ -161,50 +375,193 @@ class WriterService:
         Returns:
             list: List of responses for all prompts found using this template.
                  Each response is a dictionary containing the generated text and metadata.
-                 Failed prompts include an error message and prompt key.
+                 Failed prompts include an error message and prompt key, and prompts
+                 left to an OpenAI batch job include its ID under "pending".
 
         Raises:
             ValueError: If template_id is invalid
             Exception: If Redis operations fail or response generation fails
         """
+        return self._submit_template_responses(template_id)()
+
+    def generate_responses_by_templates(self, template_ids: Iterable[str]) -> Dict[str, list]:
+        """
+        Generate responses for all prompts of several templates.
+        Every template's uncached prompts are queued before any result is awaited,
+        so the prompt pool stays busy across templates.
+
+        Args:
+            template_ids: The IDs of the templates to generate responses for
+
+        Returns:
+            Dict[str, list]: The responses of each template, as returned by generate_responses_by_template
+        """
+        collectors = [(template_id, self._submit_template_responses(template_id)) for template_id in template_ids]
+        return {template_id: collect() for template_id, collect in collectors}
+
+    def _submit_template_responses(self, template_id: str) -> Callable[[], list]:
+        """
+        Return the cached responses of a template's prompts and queue the uncached ones for generation.
+
+        Args:
+            template_id: The ID of the template to use for finding prompts
+
+        Returns:
+            Callable[[], list]: Waits for the queued generations and returns the template's
+                responses, as returned by generate_responses_by_template
+        """
         # Get all prompt keys from Redis for this template
-        prompt_keys = self.redis_service.get_keys(f"{REDIS_KEYS.PROMPT_PREFIX}:{template_id}:*")
+        prompt_keys = self.redis_service.get_keys(generated_prompt_pattern(template_id))
         if not prompt_keys:
-            logger.debug(f"No prompts found for template ID: {template_id}")
-            return []
-
-        responses = []
-        for key in prompt_keys:
+            logger.debug("No prompts found for template ID: %s", template_id)
+            return list
+
+        # Fetch every prompt with one MGET per chunk instead of a GET per prompt
+        cached_prompts = self.redis_service.get_cached_responses(prompt_keys)
+        if not cached_prompts:
+            logger.error(f"Failed to fetch the {len(prompt_keys)} prompts of template {template_id} from Redis")
+            cached_prompts = [None] * len(prompt_keys)
+
+        responses = [None] * len(prompt_keys)
+        prepared = []
+        for index, (key, cached_prompt) in enumerate(zip(prompt_keys, cached_prompts)):
             try:
-                # Extract prompt ID from the key (format: prompt:template_id:prompt_id)
+                # Extract prompt ID from the key (format: iq:generated-prompt:{template_id}:prompt_id)
                 prompt_id = key.split(":")[-1]
-                # Generate response for this prompt
-                prompt_response = self.generate_prompt_response(template_id, prompt_id)
-                responses.append(prompt_response)
+                if not cached_prompt:
+                    logger.debug("No cached prompt found for key: %s", key)
+                    raise ValueError(f"No prompt found with key {key}")
+                prompt_data = self._parse_prompt(cached_prompt, key)
+                params, cache_key = self._build_context(prompt_data)
+                prepared.append((index, prompt_id, prompt_data, params, cache_key))
             except Exception as e:
                 logger.error(f"Error generating response for prompt {key}: {e}")
-                responses.append({"error": str(e), "prompt_key": key})
-
-        return responses
-
-    def _build_context(self, prompt_data: dict) -> tuple[dict, str]:
+                responses[index] = {"error": str(e), "prompt_key": key}
+
+        # Look up the already generated responses in bulk, so only the misses go to OpenAI
+        response_keys = [cache_key for _, _, _, _, cache_key in prepared if cache_key]
+        response_values = self.redis_service.get_cached_responses(response_keys) if response_keys else []
+        if len(response_values) != len(response_keys):
+            # Regenerating every prompt would spend OpenAI calls on responses that are likely cached
+            logger.error(f"Failed to look up the cached responses of template {template_id} in Redis")
+            for index, *_ in prepared:
+                responses[index] = {"error": "Failed to look up the cached response", "prompt_key": prompt_keys[index]}
+            return lambda: responses
+        cached_responses = dict(zip(response_keys, response_values))
+
+        # Cached responses are returned inline, the misses are generated concurrently
+        futures = []
+        misses = []
+        for index, prompt_id, prompt_data, params, cache_key in prepared:
+            cached_response = cached_responses.get(cache_key)
+            batch_id = self._pending_batch_jobs.get(cache_key) if cache_key else None
+            if cached_response:
+                response = self._respond(prompt_data, params, cache_key, cached_response)
+                responses[index] = self._add_response_metadata(response, template_id, prompt_id, prompt_data)
+            elif batch_id:
+                # A Batch API job submitted by an earlier run is still generating the response
+                responses[index] = self._add_response_metadata(
+                    {"pending": batch_id}, template_id, prompt_id, prompt_data)
+            else:
+                misses.append((index, prompt_id, prompt_data, params, cache_key))
+
+        # Only responses with a cache key can be collected from a Batch API job by a later run
+        use_batch_api = bool(self._batch_api_threshold) and (
+            sum(1 for *_, cache_key in misses if cache_key) >= self._batch_api_threshold)
+        if use_batch_api or self._openai_batch_size <= 1:
+            # Misses left out of a batch are generated on their own, and _respond shares the generation of a cache key
+            batched = []
+            for miss in misses:
+                index, prompt_id, prompt_data, params, cache_key = miss
+                if use_batch_api and cache_key:
+                    batched.append(miss)
+                    continue
+                futures.append((index, prompt_id, prompt_data, self._prompt_executor.submit(
+                    self._respond, prompt_data, params, cache_key, None)))
+            misses = batched
+
+        # Batched misses claim their cache keys like _respond, so a prompt already being
+        # generated elsewhere waits for that generation instead of joining a batch
+        leaders = []
+        for index, prompt_id, prompt_data, params, cache_key in misses:
+            generation = None
+            if cache_key:
+                generation, is_leader = self._claim_generation(cache_key)
+                if not is_leader:
+                    futures.append((index, prompt_id, prompt_data, _SharedGenerationFuture(generation)))
+                    continue
+            leaders.append((index, prompt_id, prompt_data, params, cache_key, generation))
+
+        batches = []
+        if use_batch_api and leaders:
+            # Large fan-outs are sent to the OpenAI Batch API as one job
+            batches.append((self._respond_via_batch_api, leaders))
+        elif leaders:
+            # With batching enabled, prompts of the same topic share one OpenAI request per batch
+            misses_by_topic = {}
+            for leader in leaders:
+                misses_by_topic.setdefault(leader[2]['topic'], []).append(leader)
+            for topic_misses in misses_by_topic.values():
+                for start in range(0, len(topic_misses), self._openai_batch_size):
+                    batches.append((self._respond_batch, topic_misses[start:start + self._openai_batch_size]))
+
+        for respond_batch, batch in batches:
+            batch_items = [(prompt_data, params, cache_key) for _, _, prompt_data, params, cache_key, _ in batch]
+            generations = [generation for *_, generation in batch]
+            batch_future = self._prompt_executor.submit(self._run_batch, respond_batch, batch_items, generations)
+            for position, (index, prompt_id, prompt_data, *_) in enumerate(batch):
+                futures.append((index, prompt_id, prompt_data, _BatchItemFuture(batch_future, position)))
+
+        def collect() -> list:
+            for index, prompt_id, prompt_data, future in futures:
+                try:
+                    responses[index] = self._add_response_metadata(
+                        future.result(), template_id, prompt_id, prompt_data)
+                except Exception as e:
+                    logger.error(f"Error generating response for prompt {prompt_keys[index]}: {e}")
+                    responses[index] = {"error": str(e), "prompt_key": prompt_keys[index]}
+            return responses
+
+        return collect
+
+    def _build_context(self, prompt_data: dict) -> tuple[Optional[dict], str]:
         """
-        Build context data and cache key from prompt configuration.
-        Ensures prompt_data has required context values and applies defaults where needed.
+        Build the cache key, and the context data when the cache key needs it, from prompt configuration.
+        The context data is only needed to answer a cache miss, so it is left to _context_params
+        unless the cache key has placeholders to fill.
 
         Args:
             prompt_data: The prompt configuration from Redis containing template data
                        and context parameters
 
         Returns:
-            tuple[dict, str]: A tuple containing:
-                - dict: Processed context data with defaults applied
+            tuple[Optional[dict], str]: A tuple containing:
+                - Optional[dict]: Processed context data with defaults applied, or None if not built yet
                 - str: Formatted cache key for storing the response
 
         Raises:
             KeyError: If required prompt data fields are missing
             ValueError: If prompt data format is invalid
         """
+        cache_key = prompt_data.get('cache_key')
+        if not cache_key or '{' not in cache_key:
+            return None, cache_key
+
+        params = self._context_params(prompt_data)
+        return params, _format_prompt_field(cache_key, params)
+
+    @staticmethod
+    def _context_params(prompt_data: dict) -> dict:
+        """
+        Extract the context parameters from prompt configuration.
+
+        Args:
+            prompt_data: The prompt configuration from Redis containing template data
+                       and context parameters
+
+        Returns:
+            dict: Processed context data with defaults applied
+        """
         # Format contexts structure
         formatted_contexts = {
             "promptContexts": [
@@ -216,13 +573,10 @@ class WriterService:
             ]
         }
 
-        # Extract parameters for API calls and cache key
-        params = extract_context_params(prompt_data['id'], formatted_contexts)
-        cache_key = prompt_data['cache_key'].format(**params) if 'cache_key' in prompt_data else None
+        # Extract parameters for API calls
+        return extract_context_params(prompt_data['id'], formatted_contexts)
 
-        return params, cache_key
-
-    def _get_api_data(self, params: dict, context_keys: list) -> dict:
+    def _get_api_data(self, params: dict, context_keys: list) -> Mapping[str, Any]:
         """
         Fetch and transform API data for all required context keys.
 
@@ -231,17 +585,27 @@ class WriterService:
             context_keys: List of API methods to call
 
         Returns:
-            dict: Combined API response data
+            Mapping[str, Any]: Combined API response data, layered over the parameters without copying them
         """
-        context_data = params.copy()
-
-        for context_key in context_keys:
-            api_data = self._get_context_data(context_key, params)
-            context_data[context_key] = api_data
+        api_data = {}
+        context_data = ChainMap(api_data, params)
+
+        if len(context_keys) <= 1:
+            for context_key in context_keys:
+                api_data[context_key] = self._get_context_data(context_key, params)
+            return context_data
+
+        # The API calls are I/O bound, so run them concurrently and wait for all of them
+        futures = [
+            (context_key, self._api_executor.submit(self._get_context_data, context_key, params))
+            for context_key in context_keys
+        ]
+        for context_key, future in futures:
+            api_data[context_key] = future.result()
 
         return context_data
 
-    def _build_prompt(self, prompt_data: dict, context_data: dict) -> tuple[str, str]:
+    def _build_prompt(self, prompt_data: dict, context_data: Mapping[str, Any]) -> tuple[str, str]:
         """
         Build the final prompt and system message.
 
@@ -259,18 +623,21 @@ class WriterService:
         prompt_content = self._build_prompt_data(prompt_data['topic'], context_data)
 
         # Build the prompt question and system message
-        prompt_question = prompt_data['title'].format(**context_data)
+        prompt_question = _format_prompt_field(prompt_data['title'], context_data)
         system = self._build_system(prompt_question, style_guide)
 
         return prompt_content, system
 
-    def _process_cached_prompt(self, prompt_data: dict) -> dict:
+    def _process_cached_prompt(self, prompt_data: dict, indexed_response_key: Optional[bytes] = None,
+                               indexed_response: Optional[bytes] = None) -> dict:
         """
         Process a cached prompt and generate a response, handling caching logic.
 
         Args:
             prompt_data: The cached prompt data containing template, context keys,
                        and configuration for response generation
+            indexed_response_key: The response key recorded for the prompt in the response index, if already fetched
+            indexed_response: The response cached under indexed_response_key, if already fetched
 
         Returns:
             dict: Generated response data containing:
@@ -285,14 +652,132 @@ class WriterService:
         # Build context and get cache key
         params, cache_key = self._build_context(prompt_data)
 
-        # Check cache if available
-        if cache_key:
+        # Check cache if available, reusing the response fetched with the prompt when it is for the same key
+        if not cache_key:
+            cached_response = None
+        elif indexed_response_key is not None and indexed_response_key.decode('utf-8') == cache_key:
+            cached_response = indexed_response
+        else:
             cached_response = self.redis_service.get_cached_response(cache_key)
-            if cached_response:
-                logger.debug(f"Found cached response for prompt ID: {cache_key}")
-                return {"response": cached_response.decode('utf-8')}
+        return self._respond(prompt_data, params, cache_key, cached_response)
+
+    def _respond(self, prompt_data: dict, params: Optional[dict], cache_key: str,
+                 cached_response: Optional[bytes]) -> dict:
+        """
+        Return the cached response for a prompt, or generate and cache a new one.
+
+        Args:
+            prompt_data: The cached prompt data
+            params: Parameters extracted from the prompt contexts, or None to extract them on a cache miss
+            cache_key: The key the response is cached under, if any
+            cached_response: The response already cached under cache_key, if any
 
+        Returns:
+            dict: Generated response data containing:
+                - response: The generated text
+                - context_data: The data used for generation (if generated)
+
+        Raises:
+            KeyError: If required context keys are missing
+            Exception: If API calls fail or response generation fails
+        """
+        if cached_response:
+            logger.debug("Found cached response for prompt ID: %s", cache_key)
+            return {"response": cached_response.decode('utf-8')}
+        if not cache_key:
+            return self._generate(prompt_data, params, cache_key)
+
+        # Concurrent misses for the same cache key share one generation instead of each calling OpenAI
+        generation, is_leader = self._claim_generation(cache_key)
+        if not is_leader:
+            logger.debug("Waiting for the in-flight generation of: %s", cache_key)
+            return _SharedGenerationFuture(generation).result()
+
+        try:
+            response = self._generate(prompt_data, params, cache_key)
+        except Exception as e:
+            self._finish_generation(cache_key, generation, e)
+            raise
+        self._finish_generation(cache_key, generation, response)
+        # Copied, as callers waiting on the same cache key share the response data
+        return dict(response)
+
+    def _claim_generation(self, cache_key: str) -> Tuple[Future, bool]:
+        """
+        Register the generation of a cache key's response, unless another caller already has.
+
+        Args:
+            cache_key: The key the response is cached under
+
+        Returns:
+            Tuple[Future, bool]: The future of the cache key's generation, and whether this caller
+                registered it and so must generate the response and finish it with _finish_generation
+        """
+        with self._generations_lock:
+            generation = self._generations.get(cache_key)
+            if generation is not None:
+                return generation, False
+            generation = self._generations[cache_key] = Future()
+            return generation, True
+
+    def _finish_generation(self, cache_key: str, generation: Future, result: Any) -> None:
+        """
+        Hand the result of a claimed generation to the callers waiting on it and unregister it.
+
+        Args:
+            cache_key: The key the response is cached under
+            generation: The future returned by _claim_generation
+            result: The generated response data, or the exception raised while generating it
+        """
+        if isinstance(result, Exception):
+            generation.set_exception(result)
+        else:
+            generation.set_result(result)
+        with self._generations_lock:
+            self._generations.pop(cache_key, None)
+
+    def _run_batch(self, respond_batch: Callable[[list], list], batch: list, generations: list) -> list:
+        """
+        Run a batch of prompts and finish the generations claimed for their cache keys.
+
+        Args:
+            respond_batch: _respond_batch or _respond_via_batch_api
+            batch: (prompt data, params or None, cache key) for each prompt
+            generations: The future claimed for each prompt's cache key, or None if it has no cache key
+
+        Returns:
+            list: The results of respond_batch
+        """
+        try:
+            results = respond_batch(batch)
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, _, cache_key), generation, result in zip(batch, generations, results):
+            if generation is not None:
+                self._finish_generation(cache_key, generation, result)
+        return results
+
+    def _generate(self, prompt_data: dict, params: Optional[dict], cache_key: str) -> dict:
+        """
+        Generate and cache a new response for a prompt.
+
+        Args:
+            prompt_data: The cached prompt data
+            params: Parameters extracted from the prompt contexts, or None to extract them here
+            cache_key: The key the response is cached under, if any
+
+        Returns:
+            dict: Generated response data containing:
+                - response: The generated text
+                - context_data: The data used for generation
+
+        Raises:
+            KeyError: If required context keys are missing
+            Exception: If API calls fail or response generation fails
+        """
         # Get API data for context
+        if params is None:
+            params = self._context_params(prompt_data)
         context_data = self._get_api_data(params, prompt_data.get("context_keys", []))
 
         # Build prompt and system message
@@ -300,20 +785,228 @@ class WriterService:
 
         # Generate response
         response = self.openai_service.generate_response(prompt_content, system)
-
-        # Cache if cache key is available
-        if cache_key:
-            self.redis_service.set_cached_response(
-                cache_key,
-                response,
-                prompt_data.get('ttl_seconds', CACHE_TTL.DEFAULT)
-            )
+        self._cache_responses([(prompt_data, cache_key, response)])
 
         return {
             "response": response,
             "context_data": context_data  # Include for debugging/tracking
         }
 
+    def _respond_batch(self, batch: list) -> list:
+        """
+        Generate and cache the responses for several uncached prompts of the same topic
+        with a single OpenAI request. Prompts the batched request does not answer are
+        generated individually.
+
+        Args:
+            batch: (prompt data, params or None, cache key) for each prompt
+
+        Returns:
+            list: For each prompt in order, its response data as returned by _respond,
+                or the exception raised while generating it
+        """
+        style_guide = self.style_parser.get_style_guide()
+        results, prepared = self._prepare_batch(batch)
+
+        answers = {}
+        if len(prepared) > 1:
+            try:
+                answers = self.openai_service.generate_batch(
+                    [(prompt_data['id'], question, content) for _, prompt_data, _, _, content, question in prepared],
+                    self._build_system(BATCH_QUESTION, style_guide))
+            except Exception as e:
+                logger.warning(f"Batched OpenAI request failed, generating {len(prepared)} prompts individually: {e}")
+
+        generated = []
+        for position, prompt_data, cache_key, context_data, prompt_content, prompt_question in prepared:
+            try:
+                response = answers.get(prompt_data['id'])
+                if response is None:
+                    response = self.openai_service.generate_response(
+                        prompt_content, self._build_system(prompt_question, style_guide))
+                generated.append((position, prompt_data, cache_key, context_data, response))
+            except Exception as e:
+                results[position] = e
+
+        return self._cache_batch_results(results, generated)
+
+    def _respond_via_batch_api(self, batch: list) -> list:
+        """
+        Submit one OpenAI Batch API job for many uncached prompts, without waiting for it.
+        The job is recorded in Redis, and collect_batch_jobs caches its responses on a later run.
+
+        Args:
+            batch: (prompt data, params or None, cache key) for each prompt, all with a cache key
+
+        Returns:
+            list: For each prompt in order, {"pending": batch job ID} once the job is recorded,
+                or the exception raised while building or submitting it
+        """
+        style_guide = self.style_parser.get_style_guide()
+        results, prepared = self._prepare_batch(batch)
+        if not prepared:
+            return results
+
+        try:
+            # The cache keys are the custom IDs, so the job's output maps straight back to them
+            batch_id = self.openai_service.submit_batch_job([
+                (cache_key, content, self._build_system(question, style_guide))
+                for _, _, cache_key, _, content, question in prepared
+            ])
+            job = {
+                cache_key: [prompt_data['id'], prompt_data.get('ttl_seconds', CACHE_TTL.DEFAULT)]
+                for _, prompt_data, cache_key, *_ in prepared
+            }
+            if not self.redis_service.set_cached_response(
+                    f"{REDIS_KEYS.BATCH_JOB_PREFIX}:{batch_id}", orjson.dumps(job), WRITER_CONFIG.BATCH_API_JOB_TTL):
+                raise Exception(f"Failed to record OpenAI batch job {batch_id} in Redis")
+        except Exception as e:
+            for position, *_ in prepared:
+                results[position] = e
+            return results
+
+        logger.info(f"Submitted OpenAI batch job {batch_id} for {len(prepared)} prompts")
+        # Registered before the generations are finished, so later templates find the keys pending
+        self._pending_batch_jobs.update(dict.fromkeys(job, batch_id))
+        for position, *_ in prepared:
+            results[position] = {"pending": batch_id}
+        return results
+
+    def collect_batch_jobs(self) -> int:
+        """
+        Cache the responses of the OpenAI Batch API jobs submitted by earlier runs that have completed.
+        Each job is checked once instead of being waited on. The prompts of a job still running
+        are reported as pending by this run rather than being submitted again.
+
+        Returns:
+            int: The number of responses cached
+        """
+        job_keys = self.redis_service.get_keys(f"{REDIS_KEYS.BATCH_JOB_PREFIX}:*")
+        if not job_keys:
+            return 0
+        job_records = self.redis_service.get_cached_responses(job_keys)
+        if len(job_records) != len(job_keys):
+            logger.error(f"Failed to fetch the {len(job_keys)} OpenAI batch job records from Redis")
+            return 0
+
+        collected = 0
+        for job_key, job_record in zip(job_keys, job_records):
+            if not job_record:
+                continue
+            batch_id = job_key.split(":")[-1]
+            try:
+                job = orjson.loads(job_record)
+            except orjson.JSONDecodeError:
+                logger.error(f"Invalid JSON in OpenAI batch job record: {job_key}")
+                self.redis_service.delete_cached_response(job_key)
+                continue
+
+            try:
+                status, answers = self.openai_service.get_batch_job_results(batch_id)
+            except Exception:
+                # Checked again by the next run, until the record expires
+                status, answers = None, None
+            if answers is None:
+                logger.info(f"OpenAI batch job {batch_id} is still pending for {len(job)} prompts")
+                self._pending_batch_jobs.update(dict.fromkeys(job, batch_id))
+                continue
+
+            # Jobs that failed, expired or were cancelled still hand back the requests they finished
+            entries = [
+                (prompt_id, cache_key, answers[cache_key], ttl_seconds)
+                for cache_key, (prompt_id, ttl_seconds) in job.items()
+                if cache_key in answers
+            ]
+            if entries and not self.redis_service.set_indexed_responses(REDIS_KEYS.RESPONSE_INDEX, entries):
+                logger.error(f"Failed to cache the responses of OpenAI batch job {batch_id}, "
+                             f"keeping it for the next run")
+                self._pending_batch_jobs.update(dict.fromkeys(job, batch_id))
+                continue
+            if len(entries) < len(job):
+                logger.warning(f"OpenAI batch job {batch_id} finished with status {status} and answered "
+                               f"{len(entries)} of {len(job)} prompts, the rest will be generated again")
+            self.redis_service.delete_cached_response(job_key)
+            # The job is done with, so its prompts are no longer reported as pending
+            for cache_key in job:
+                self._pending_batch_jobs.pop(cache_key, None)
+            collected += len(entries)
+
+        return collected
+
+    def _prepare_batch(self, batch: list) -> Tuple[list, list]:
+        """
+        Fetch the API data of every prompt in a batch and build its content and question.
+
+        Args:
+            batch: (prompt data, params or None, cache key) for each prompt
+
+        Returns:
+            Tuple[list, list]: The results of the batch, holding the exception of each prompt
+                that could not be built, and (position, prompt data, cache key, context data,
+                prompt content, prompt question) for each prompt that was
+        """
+        results = [None] * len(batch)
+        prepared = []
+        for position, (prompt_data, params, cache_key) in enumerate(batch):
+            try:
+                if params is None:
+                    params = self._context_params(prompt_data)
+                context_data = self._get_api_data(params, prompt_data.get("context_keys", []))
+                prompt_content = self._build_prompt_data(prompt_data['topic'], context_data)
+                prompt_question = _format_prompt_field(prompt_data['title'], context_data)
+                prepared.append((position, prompt_data, cache_key, context_data, prompt_content, prompt_question))
+            except Exception as e:
+                results[position] = e
+        return results, prepared
+
+    def _cache_batch_results(self, results: list, generated: list) -> list:
+        """
+        Cache the responses generated for a batch with one write, and record them in the batch results.
+
+        Args:
+            results: The results of the batch, already holding the exception of each failed prompt
+            generated: (position, prompt data, cache key, context data, response) for each generated prompt
+
+        Returns:
+            list: The results of the batch. A generated prompt holds its response data once the
+                write has landed, or the exception raised if it did not.
+        """
+        try:
+            self._cache_responses([
+                (prompt_data, cache_key, response) for _, prompt_data, cache_key, _, response in generated
+            ])
+        except Exception as e:
+            for position, *_ in generated:
+                results[position] = e
+            return results
+
+        for position, _, _, context_data, response in generated:
+            results[position] = {
+                "response": response,
+                "context_data": context_data  # Include for debugging/tracking
+            }
+        return results
+
+    def _cache_responses(self, generated: list) -> None:
+        """
+        Cache generated responses, indexed by prompt ID so readers can find them without a scan.
+        The writes are sent as one pipeline and checked, so a response only counts as generated
+        once it has reached Redis. Prompts without a cache key are not cached.
+
+        Args:
+            generated: (prompt data, cache key, response) for each generated response
+
+        Raises:
+            Exception: If the responses could not be written to Redis
+        """
+        entries = [
+            (prompt_data['id'], cache_key, response, prompt_data.get('ttl_seconds', CACHE_TTL.DEFAULT))
+            for prompt_data, cache_key, response in generated
+            if cache_key
+        ]
+        if entries and not self.redis_service.set_indexed_responses(REDIS_KEYS.RESPONSE_INDEX, entries):
+            raise Exception(f"Failed to cache {len(entries)} generated responses in Redis")
+
     def generate_prompt_response(self, prompt_template_id: str, prompt_id: str) -> dict:
         """
         Generate a response using the cached prompt from Redis.
@@ -328,37 +1021,112 @@ class WriterService:
         Raises:
             ValueError: If prompt not found or invalid
         """
-        # Get prompt configuration from Redis
-        redis_key = f"{REDIS_KEYS.GENERATED_PROMPT_PREFIX}:{prompt_template_id}:{prompt_id}"
-        cached_prompt = self.redis_service.get_cached_response(redis_key)
+        # Get prompt configuration from the hot prompts, or from Redis unless it was just found missing.
+        # The response indexed for the prompt is fetched along with it, so a cached response
+        # needs no separate lookup.
+        redis_key = generated_prompt_key(prompt_template_id, prompt_id)
+        with self._hot_prompts_lock:
+            hot_prompt = self._hot_prompts.get(redis_key)
+        if hot_prompt is not None:
+            return self.generate_response_for_prompt(prompt_template_id, prompt_id, *hot_prompt)
+
+        with self._missing_prompts_lock:
+            known_missing = redis_key in self._missing_prompts
+        cached_prompt = response_key = cached_response = None
+        if not known_missing:
+            cached_prompt, response_key, cached_response = self.redis_service.get_with_indexed(
+                redis_key, REDIS_KEYS.RESPONSE_INDEX, prompt_id)
 
         if not cached_prompt:
-            logger.debug(f"No cached prompt found for key: {redis_key}")
+            logger.debug("No cached prompt found for key: %s", redis_key)
+            if not known_missing:
+                with self._missing_prompts_lock:
+                    self._missing_prompts[redis_key] = True
             raise ValueError(f"No prompt found with key {redis_key}")
 
+        # Only prompts with a cached response are kept, so an uncached one is looked up again once generated
+        if cached_response:
+            with self._hot_prompts_lock:
+                self._hot_prompts[redis_key] = (cached_prompt, response_key, cached_response)
+
+        return self.generate_response_for_prompt(prompt_template_id, prompt_id, cached_prompt,
+                                                 response_key, cached_response)
+
+    def generate_response_for_prompt(self, prompt_template_id: str, prompt_id: str, cached_prompt: bytes,
+                                     response_key: Optional[bytes] = None,
+                                     cached_response: Optional[bytes] = None) -> dict:
+        """
+        Generate a response for a prompt that has already been fetched from Redis.
+
+        Args:
+            prompt_template_id: ID of the template the prompt was generated from
+            prompt_id: The ID of the prompt to use
+            cached_prompt: The cached prompt configuration as stored in Redis
+            response_key: The response key recorded for the prompt in the response index, if already fetched
+            cached_response: The response cached under response_key, if already fetched
+
+        Returns:
+            dict: Generated response with metadata
+
+        Raises:
+            ValueError: If prompt is invalid
+        """
         try:
-            # Parse and validate prompt configuration
-            prompt_data = json.loads(cached_prompt.decode('utf-8'))
-            required_fields = ['topic', 'title', 'context_keys']
-            if not all(field in prompt_data for field in required_fields):
-                raise ValueError(f"Invalid prompt configuration: missing required fields {required_fields}")
+            prompt_data = self._parse_prompt(cached_prompt, generated_prompt_key(prompt_template_id, prompt_id))
 
             # Generate response using prompt configuration
-            response = self._process_cached_prompt(prompt_data)
-
-            # Add metadata to response
-            response.update({
-                "prompt_id": prompt_id,
-                "template_id": prompt_template_id,
-                "topic": prompt_data['topic'],
-                "context_keys": prompt_data['context_keys']
-            })
+            response = self._process_cached_prompt(prompt_data, response_key, cached_response)
 
-            return response
+            return self._add_response_metadata(response, prompt_template_id, prompt_id, prompt_data)
 
-        except json.JSONDecodeError:
-            logger.error(f"Invalid JSON in cached prompt: {redis_key}")
-            raise ValueError("Invalid prompt configuration format")
         except Exception as e:
             logger.error(f"Error generating response using cached prompt: {e}")
             raise
+
+    @staticmethod
+    def _parse_prompt(cached_prompt: bytes, redis_key: str) -> dict:
+        """
+        Parse and validate a prompt configuration as stored in Redis.
+
+        Args:
+            cached_prompt: The cached prompt configuration
+            redis_key: The Redis key of the prompt, for logging
+
+        Returns:
+            dict: The prompt configuration
+
+        Raises:
+            ValueError: If the prompt is not valid JSON or is missing required fields
+        """
+        try:
+            prompt_data = orjson.loads(cached_prompt)
+        except orjson.JSONDecodeError:
+            logger.error(f"Invalid JSON in cached prompt: {redis_key}")
+            raise ValueError("Invalid prompt configuration format")
+
+        required_fields = ['topic', 'title', 'context_keys']
+        if not all(field in prompt_data for field in required_fields):
+            raise ValueError(f"Invalid prompt configuration: missing required fields {required_fields}")
+        return prompt_data
+
+    @staticmethod
+    def _add_response_metadata(response: dict, prompt_template_id: str, prompt_id: str, prompt_data: dict) -> dict:
+        """
+        Add the prompt metadata to a generated response.
+
+        Args:
+            response: The generated response data
+            prompt_template_id: ID of the template the prompt was generated from
+            prompt_id: The ID of the prompt
+            prompt_data: The prompt configuration
+
+        Returns:
+            dict: The response with its metadata
+        """
+        response.update({
+            "prompt_id": prompt_id,
+            "template_id": prompt_template_id,
+            "topic": prompt_data['topic'],
+            "context_keys": prompt_data['context_keys']
+        })
+        return response
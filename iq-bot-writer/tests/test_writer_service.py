@@ -0,0 +1,88 @@
+"""Tests for the single-flight generation of cache misses in WriterService."""
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services import writer_service  # noqa: E402
+
+CACHE_KEY = "iq:prompt-response:p1"
+PROMPT_DATA = {'id': 'p1', 'topic': 'spells', 'title': 'Spell', 'context_keys': [], 'cache_key': CACHE_KEY}
+WAIT_SECONDS = 5
+
+
+class SingleFlightTest(unittest.TestCase):
+    """Concurrent misses for the same cache key share one generation."""
+
+    def setUp(self):
+        with mock.patch.object(writer_service, 'RedisService'), \
+                mock.patch.object(writer_service, '_preload_resource_templates'):
+            self.writer = writer_service.WriterService()
+        self.addCleanup(self.writer.shutdown)
+
+        self.leader_started = threading.Event()
+        self.follower_claimed = threading.Event()
+        self.release_leader = threading.Event()
+
+        claim_generation = self.writer._claim_generation
+
+        def claim_and_signal(cache_key):
+            generation, is_leader = claim_generation(cache_key)
+            if not is_leader:
+                self.follower_claimed.set()
+            return generation, is_leader
+
+        self.writer._claim_generation = claim_and_signal
+
+    def _respond_concurrently(self):
+        """Start a leader, let a follower join its generation, then let the leader finish."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(self.writer._respond, PROMPT_DATA, {}, CACHE_KEY, None)
+            self.assertTrue(self.leader_started.wait(WAIT_SECONDS))
+            follower = executor.submit(self.writer._respond, PROMPT_DATA, {}, CACHE_KEY, None)
+            self.assertTrue(self.follower_claimed.wait(WAIT_SECONDS))
+            self.release_leader.set()
+            return leader, follower
+
+    def _blocking_generate(self, result):
+        def generate(prompt_data, params, cache_key):
+            self.leader_started.set()
+            self.release_leader.wait(WAIT_SECONDS)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return mock.Mock(side_effect=generate)
+
+    def test_follower_gets_leader_result(self):
+        self.writer._generate = self._blocking_generate({"response": "lumos", "context_data": {}})
+
+        leader, follower = self._respond_concurrently()
+
+        self.assertEqual(leader.result(WAIT_SECONDS), {"response": "lumos", "context_data": {}})
+        self.assertEqual(follower.result(WAIT_SECONDS), leader.result())
+        self.assertIsNot(follower.result(), leader.result())
+        self.writer._generate.assert_called_once()
+        self.assertEqual(self.writer._generations, {})
+
+    def test_leader_failure_propagates_to_follower(self):
+        self.writer._generate = self._blocking_generate(Exception("OpenAI unavailable"))
+
+        leader, follower = self._respond_concurrently()
+
+        for future in (leader, follower):
+            with self.assertRaisesRegex(Exception, "OpenAI unavailable"):
+                future.result(WAIT_SECONDS)
+        self.writer._generate.assert_called_once()
+        self.assertEqual(self.writer._generations, {})
+
+        # The failure is not cached, so the next miss generates the response again
+        self.writer._generate = mock.Mock(return_value={"response": "nox"})
+        self.assertEqual(self.writer._respond(PROMPT_DATA, {}, CACHE_KEY, None), {"response": "nox"})
+
+
+if __name__ == '__main__':
+    unittest.main()